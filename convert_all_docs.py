@@ -1,87 +1,553 @@
 #!/usr/bin/env python3
+import argparse
+import hashlib
+import json
 import os
 import re
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from xml.sax.saxutils import escape
 
-def convert_md_to_pdf(md_file, output_pdf):
-    """Convert a markdown file to PDF using pandoc with xelatex"""
-    print(f"Converting {md_file} to {output_pdf}...")
+# Cache manifest, kept next to the temp_html/ working directory
+CACHE_MANIFEST = "doc_cache.json"
+
+# Options passed to pandoc; part of the cache key
+PANDOC_OPTIONS = ['--pdf-engine=xelatex', '-V', 'geometry:margin=1in']
+
+# Markdown extensions used by the in-process backend
+MARKDOWN_EXTENSIONS = ['tables', 'fenced_code', 'codehilite']
+
+# Stylesheet shared by every document rendered in-process
+DOCUMENT_CSS = """
+body {
+    font-family: Arial, sans-serif;
+    margin: 40px;
+    line-height: 1.6;
+}
+h1, h2, h3, h4 {
+    color: #333;
+}
+code {
+    background-color: #f5f5f5;
+    padding: 2px 4px;
+    border-radius: 4px;
+}
+pre {
+    background-color: #f5f5f5;
+    padding: 10px;
+    border-radius: 4px;
+    overflow-x: auto;
+}
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 20px 0;
+}
+table, th, td {
+    border: 1px solid #ddd;
+}
+th, td {
+    padding: 8px;
+    text-align: left;
+}
+th {
+    background-color: #f2f2f2;
+}
+"""
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+# Fenced blocks in these languages are left for the renderer to highlight
+CODE_LANGUAGES = ('python', 'bash', 'javascript', 'json', 'html', 'css')
+
+# Characters the PDF fonts may lack, replaced in a single translate() pass
+UNICODE_REPLACEMENTS = str.maketrans({'Ω': 'Ohm', 'μ': 'u'})
+
+MERMAID_NOTE = ('<div style="background-color: #ffffd9; padding: 10px; border: 1px solid #e6e6b8; border-radius: 4px;">\n'
+                '<em>Mermaid diagram removed for PDF compatibility</em>\n</div>')
+PRE_OPEN = '<pre style="font-family: monospace; white-space: pre;">'
+
+# Box-drawing characters, arrows or +--/--> runs mark a block as an ASCII diagram
+DIAGRAM_PATTERN = re.compile(r'[\u2500-\u257f\u2190-\u21ff\u25a0-\u25ff]|[+|]-{2,}|-{2,}[+>|]')
+
+# Rendered diagrams, named by a hash of their source; kept across builds
+DIAGRAM_DIR = os.path.join("temp_html", "diagrams")
+
+# Local mermaid renderer (mermaid-cli); without it mermaid sources are
+# typeset as text images like ASCII diagrams
+MMDC = shutil.which('mmdc')
+
+# Marker next to a diagram whose mmdc run failed: the text fallback is used
+# for this build, and the next build tries mmdc again
+FALLBACK_SUFFIX = '.fallback'
+
+
+def preprocess_lines(lines, diagrams=None, base_dir=".", plain_text=True):
+    """
+    Rewrite markdown lines so the PDF backends can typeset them
     
-    # Create temp directory if it doesn't exist
-    temp_dir = "temp_html"
-    os.makedirs(temp_dir, exist_ok=True)
+    A single pass over the input with a small fenced-block state machine.
+    With plain_text (what pandoc/xelatex needs):
+    - Unicode symbols are replaced on every line
+    - mermaid blocks become a placeholder note
+    - other unlabelled or non-code blocks (ASCII diagrams) become <pre> blocks
+    Without it (HTML backends), the text and those blocks are left as they
+    are. Code blocks in CODE_LANGUAGES always pass through unchanged.
     
-    # Create a processed version of the markdown file
-    processed_md = f"{temp_dir}/{os.path.basename(md_file)}_processed.md"
+    When a diagrams dict is given, mermaid blocks and blocks that look like
+    ASCII diagrams (DIAGRAM_PATTERN) are replaced by image references
+    instead, relative to base_dir (the source document's directory), and
+    the dict maps each image's key to the (kind, source) to render with
+    render_diagrams().
     
-    # Read the markdown file
-    with open(md_file, 'r') as f:
-        md_content = f.read()
-    
-    # Replace problematic Unicode characters
-    md_content = md_content.replace('Ω', 'Ohm')
-    md_content = md_content.replace('μ', 'u')
-    
-    # Process mermaid blocks - replace with a note
-    md_content = re.sub(
-        r'```mermaid(.*?)```',
-        r'<div style="background-color: #ffffd9; padding: 10px; border: 1px solid #e6e6b8; border-radius: 4px;">\n<em>Mermaid diagram removed for PDF compatibility</em>\n</div>',
-        md_content, 
-        flags=re.DOTALL
-    )
-    
-    # Handle ASCII diagrams by replacing with a note for box-drawing characters
-    ascii_art_pattern = r'```(?!python|bash|javascript|json|html|css)(.+?)```'
-    md_content = re.sub(
-        ascii_art_pattern,
-        r'<pre style="font-family: monospace; white-space: pre;">\1</pre>',
-        md_content,
-        flags=re.DOTALL
-    )
-    
-    # Save the processed markdown file
-    with open(processed_md, 'w') as f:
-        f.write(md_content)
-    
-    # Try direct pandoc conversion (best compatibility)
+    Only the lines of the current diagram block are held in memory; an
+    unterminated fence is emitted unchanged at the end.
+    
+    Yields:
+        str: Processed text, in order
+    """
+    kind = None  # None outside a fence, else "code", "mermaid" or "pre"
+    block = []
+    for line in lines:
+        if plain_text and not line.isascii():
+            line = line.translate(UNICODE_REPLACEMENTS)
+        # Cheap substring test first; most lines are plain text
+        fence = '```' in line and line.lstrip().startswith('```')
+        if kind is None:
+            if not fence:
+                yield line
+                continue
+            stripped = line.lstrip()
+            info = stripped[3:]
+            if info.startswith('mermaid'):
+                kind = 'mermaid'
+            elif info.startswith(CODE_LANGUAGES):
+                kind = 'code'
+                yield line
+                continue
+            else:
+                kind = 'pre'
+            block = [line]
+        elif kind == 'code':
+            yield line
+            if fence:
+                kind = None
+        elif not fence:
+            block.append(line)
+        else:
+            stripped = line.lstrip()
+            opening = block[0]
+            indent = opening[:len(opening) - len(opening.lstrip())]
+            after = stripped[3:]
+            source = ''.join(block[1:])
+            if diagrams is not None and (kind == 'mermaid' or DIAGRAM_PATTERN.search(source)):
+                key = diagram_key(kind, source)
+                diagrams[key] = (kind, source)
+                yield f"{indent}![{kind} diagram]({diagram_ref(key, base_dir)}){after}"
+            elif not plain_text:
+                yield ''.join(block) + line
+            elif kind == 'mermaid':
+                yield indent + MERMAID_NOTE + after
+            else:
+                block[0] = opening.lstrip()[3:]
+                block.append(line[:len(line) - len(stripped)])
+                yield indent + PRE_OPEN + ''.join(block) + '</pre>' + after
+            kind = None
+            block = []
+    if kind is not None:
+        yield ''.join(block)
+
+
+def diagram_key(kind, source):
+    """Hash of a diagram block and the renderer that will draw it"""
+    renderer = 'mmdc' if kind == 'mermaid' and MMDC else 'text'
+    return hashlib.sha256(f"{kind}\0{renderer}\0{source}".encode('utf-8')).hexdigest()[:20]
+
+
+def diagram_path(key):
+    """Path of a rendered diagram"""
+    return os.path.join(DIAGRAM_DIR, f"{key}.svg")
+
+
+def diagram_ref(key, base_dir="."):
+    """
+    Link to a rendered diagram from a document in base_dir
+    
+    Relative, so the processed markdown (and with it the build cache key)
+    does not change when the checkout moves.
+    """
+    return os.path.relpath(diagram_path(key), base_dir).replace(os.sep, '/')
+
+
+def diagram_cached(key):
+    """True if the diagram is rendered and is not a fallback from a failed mmdc run"""
+    path = diagram_path(key)
+    return os.path.exists(path) and not os.path.exists(path + FALLBACK_SUFFIX)
+
+
+def text_svg(source, background="#f5f5f5"):
+    """Draw a block of text (an ASCII diagram) as an SVG image"""
+    lines = source.expandtabs().rstrip('\n').split('\n')
+    char_width, line_height, pad = 8.4, 17, 10
+    width = pad * 2 + char_width * max((len(line) for line in lines), default=0)
+    height = pad * 2 + line_height * len(lines)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height}" '
+        f'viewBox="0 0 {width:g} {height}">',
+        f'<rect width="{width:g}" height="{height}" rx="4" fill="{background}"/>',
+        '<text font-family="DejaVu Sans Mono, Courier New, monospace" font-size="14" '
+        'xml:space="preserve">',
+    ]
+    for i, line in enumerate(lines):
+        parts.append(f'<tspan x="{pad}" y="{pad + line_height * (i + 0.8):g}">{escape(line)}</tspan>')
+    parts.append('</text></svg>\n')
+    return '\n'.join(parts)
+
+
+def render_diagram(key, kind, source):
+    """
+    Render one diagram block to its cached SVG file
+    
+    Returns:
+        bool: True if the file was rendered, False if it was already cached
+    """
+    path = diagram_path(key)
+    if diagram_cached(key):
+        return False
+    os.makedirs(DIAGRAM_DIR, exist_ok=True)
+    # Render to a private name first so concurrent builds never see a
+    # partial file
+    partial = f"{path}.{os.getpid()}.{threading.get_ident()}.svg"
     try:
-        pandoc_cmd = [
-            'pandoc',
-            processed_md,
-            '-o', output_pdf,
-            '--pdf-engine=xelatex',
-            '-V', 'geometry:margin=1in'
-        ]
-        subprocess.run(pandoc_cmd, check=True)
+        if kind == 'mermaid' and MMDC:
+            source_file = f"{partial}.mmd"
+            with open(source_file, 'w') as f:
+                f.write(source)
+            try:
+                subprocess.run([MMDC, '-i', source_file, '-o', partial, '-b', 'white', '-q'],
+                               check=True, stdout=subprocess.DEVNULL)
+            finally:
+                os.remove(source_file)
+        else:
+            with open(partial, 'w') as f:
+                f.write(text_svg(source, "#ffffd9" if kind == 'mermaid' else "#f5f5f5"))
+        os.replace(partial, path)
+        if os.path.exists(path + FALLBACK_SUFFIX):
+            os.remove(path + FALLBACK_SUFFIX)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Diagram rendering failed ({e}); using the source as text")
+        # Mark the file first, so it is never mistaken for an mmdc render
+        open(path + FALLBACK_SUFFIX, 'w').close()
+        with open(partial, 'w') as f:
+            f.write(text_svg(source, "#ffffd9"))
+        os.replace(partial, path)
+    return True
+
+
+def render_diagrams(diagrams, jobs=4):
+    """
+    Render every diagram that is not cached yet, in parallel
+    
+    Returns:
+        int: Number of diagrams rendered
+    """
+    missing = [(key, kind, source) for key, (kind, source) in diagrams.items()
+               if not diagram_cached(key)]
+    if not missing:
+        return 0
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return sum(pool.map(lambda item: render_diagram(*item), missing))
+
+
+def preprocess_markdown(md_content):
+    """Rewrite a markdown document so pandoc/xelatex can typeset it"""
+    return ''.join(preprocess_lines(md_content.splitlines(True)))
+
+
+def preprocess_file(src, dst):
+    """
+    Stream one markdown file through the preprocessor into another
+    
+    Returns:
+        int: Characters written
+    """
+    written = 0
+    with open(src, 'r') as f_in, open(dst, 'w') as f_out:
+        for chunk in preprocess_lines(f_in):
+            f_out.write(chunk)
+            written += len(chunk)
+    return written
+
+
+SYNTHETIC_SECTION = """## Section
+
+The 2-bit ALU uses 330Ω resistors and 0.1μF capacitors on every IC.
+
+```mermaid
+graph TD
+    A[Input A] --> ALU
+    ALU --> R[Result]
+```
+
+```
++-----+     +-----+
+| A   |---->| ALU |
++-----+     +-----+
+```
+
+```python
+result = a & b
+```
+
+"""
+
+
+def bench_preprocess(size_mb=100):
+    """
+    Measure preprocessor throughput on a synthetic markdown file
+    
+    Returns:
+        float: Megabytes per second
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "synthetic.md")
+        dst = os.path.join(tmp, "synthetic_processed.md")
+        repeats = max(1, int(size_mb * 1024 * 1024) // len(SYNTHETIC_SECTION.encode('utf-8')))
+        chunk = SYNTHETIC_SECTION * 1000
+        with open(src, 'w') as f:
+            for _ in range(repeats // 1000):
+                f.write(chunk)
+            f.write(SYNTHETIC_SECTION * (repeats % 1000))
+        size = os.path.getsize(src) / (1024 * 1024)
+        start = time.perf_counter()
+        preprocess_file(src, dst)
+        elapsed = time.perf_counter() - start
+    rate = size / elapsed
+    print(f"Preprocessed {size:.1f} MB in {elapsed:.2f} s ({rate:.1f} MB/s)")
+    return rate
+
+
+class WeasyPrintBackend:
+    """
+    In-process markdown -> HTML -> PDF rendering with markdown + weasyprint
+    
+    The markdown parser, the parsed stylesheet and the font configuration are
+    created once and reused for every document, so each conversion only pays
+    for layout. Not thread-safe: concurrent conversions run in worker
+    processes, each with its own instance.
+    """
+    
+    name = "weasyprint"
+    parallel = False
+    plain_text = False  # HTML keeps Unicode and renders fenced blocks itself
+    
+    def __init__(self):
+        import markdown
+        from weasyprint import CSS, HTML
+        from weasyprint.text.fonts import FontConfiguration
+        
+        self.HTML = HTML
+        self.markdown = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        self.font_config = FontConfiguration()
+        self.stylesheet = CSS(string=DOCUMENT_CSS, font_config=self.font_config)
+        self.options = [MARKDOWN_EXTENSIONS, hashlib.sha256(DOCUMENT_CSS.encode('utf-8')).hexdigest()]
+    
+    def render_html(self, md_content, title):
+        """Convert processed markdown into a complete HTML document"""
+        body = self.markdown.reset().convert(md_content)
+        return HTML_TEMPLATE.format(title=title, body=body)
+    
+    def convert(self, md_file, md_content, output_pdf, temp_prefix):
+        """Render one document; returns True on success"""
+        title = os.path.splitext(os.path.basename(md_file))[0].replace('_', ' ').title()
+        try:
+            html = self.render_html(md_content, title)
+            self.HTML(string=html, base_url=os.path.dirname(os.path.abspath(md_file))).write_pdf(
+                output_pdf, stylesheets=[self.stylesheet], font_config=self.font_config)
+        except Exception as e:
+            print(f"WeasyPrint conversion failed: {e}")
+            return False
         print(f"PDF created at: {output_pdf}")
         return True
-    except Exception as e:
-        print(f"Pandoc direct conversion failed: {e}")
+
+
+class PandocBackend:
+    """pandoc + xelatex in a subprocess per document, falling back to grip"""
+    
+    name = "pandoc"
+    parallel = True
+    plain_text = True
+    options = PANDOC_OPTIONS
+    
+    def __init__(self):
+        if shutil.which('pandoc') is None:
+            raise OSError("pandoc is not installed")
+    
+    def convert(self, md_file, md_content, output_pdf, temp_prefix):
+        """Write the processed markdown and typeset it; returns True on success"""
+        # Save the processed markdown file
+        processed_md = f"{temp_prefix}_processed.md"
+        with open(processed_md, 'w') as f:
+            f.write(md_content)
+        
+        # Relative image links (including diagrams) are relative to the
+        # source document, not to the processed copy
+        resources = ['--resource-path', os.pathsep.join([os.path.dirname(md_file) or '.', '.'])]
         
-        # Fallback to grip + pandoc
+        # Try direct pandoc conversion (best compatibility)
         try:
-            # First render as HTML
-            html_output = f"{temp_dir}/{os.path.basename(md_file)}.html"
-            subprocess.run(['grip', processed_md, '--export', html_output], check=True)
-            
-            # Then convert HTML to PDF
-            pandoc_html_cmd = [
-                'pandoc',
-                html_output,
-                '-o', output_pdf,
-                '--pdf-engine=xelatex',
-                '-V', 'geometry:margin=1in'
-            ]
-            subprocess.run(pandoc_html_cmd, check=True)
-            print(f"PDF created with grip+pandoc at: {output_pdf}")
+            pandoc_cmd = ['pandoc', processed_md, '-o', output_pdf] + resources + PANDOC_OPTIONS
+            subprocess.run(pandoc_cmd, check=True)
+            print(f"PDF created at: {output_pdf}")
             return True
-        except Exception as e2:
-            print(f"All conversion methods failed: {e2}")
-            return False
+        except Exception as e:
+            print(f"Pandoc direct conversion failed: {e}")
+            
+            # Fallback to grip + pandoc
+            try:
+                # First render as HTML
+                html_output = f"{temp_prefix}.html"
+                subprocess.run(['grip', processed_md, '--export', html_output], check=True)
+                
+                # Then convert HTML to PDF
+                pandoc_html_cmd = ['pandoc', html_output, '-o', output_pdf] + resources + PANDOC_OPTIONS
+                subprocess.run(pandoc_html_cmd, check=True)
+                print(f"PDF created with grip+pandoc at: {output_pdf}")
+                return True
+            except Exception as e2:
+                print(f"All conversion methods failed: {e2}")
+                return False
+
+
+BACKENDS = {
+    "weasyprint": WeasyPrintBackend,
+    "pandoc": PandocBackend,
+}
+
+# One live instance per backend, shared by all conversions in this process
+_backends = {}
+
+
+def get_backend(name):
+    """
+    Return the shared instance of a backend
+    
+    Raises ImportError or OSError when the backend's tools are missing.
+    """
+    if name not in _backends:
+        _backends[name] = BACKENDS[name]()
+    return _backends[name]
+
+
+def choose_backend(name):
+    """
+    Return the named backend, falling back from weasyprint to pandoc
+    
+    Returns:
+        The backend instance, or None (with the reason printed) when no
+        backend is available
+    """
+    try:
+        return get_backend(name)
+    except (ImportError, OSError) as e:
+        if name == "pandoc":
+            print(f"Error: {e}")
+            return None
+        print(f"In-process backend unavailable ({e}); falling back to pandoc")
+        try:
+            return get_backend("pandoc")
+        except OSError as e2:
+            print(f"Error: neither WeasyPrint nor pandoc is available ({e2})")
+            return None
+
+
+def load_cache(path=CACHE_MANIFEST):
+    """Load the build cache manifest, or an empty one"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache, path=CACHE_MANIFEST):
+    """Write the build cache manifest"""
+    with open(path, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def cache_key(md_content, output_pdf, backend):
+    """Hash of the processed markdown plus everything that affects the PDF"""
+    digest = hashlib.sha256(md_content.encode('utf-8'))
+    digest.update(json.dumps([output_pdf, backend.name, backend.options]).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def convert_md_to_pdf(md_file, output_pdf, cache=None, backend=None, diagrams=True):
+    """
+    Convert a markdown file to PDF with the given backend (pandoc by default)
+    
+    When a cache dict is given, the conversion is skipped if the processed
+    markdown and options are unchanged and the PDF still exists. With
+    diagrams enabled, mermaid and ASCII blocks are embedded as SVG images.
+    
+    Returns:
+        tuple: (success, cached, seconds saved or spent)
+    """
+    backend = backend or get_backend("pandoc")
+    
+    # Create temp directory if it doesn't exist
+    temp_dir = "temp_html"
+    os.makedirs(temp_dir, exist_ok=True)
+    
+    # Temp files are named after the full source path so documents
+    # converted in parallel never share them
+    temp_name = md_file.replace(os.sep, "_").replace("/", "_")
+    
+    # Read the markdown file
+    blocks = {} if diagrams else None
+    base_dir = os.path.dirname(md_file) or "."
+    with open(md_file, 'r') as f:
+        md_content = ''.join(preprocess_lines(f, blocks, base_dir, backend.plain_text))
+    
+    key = cache_key(md_content, output_pdf, backend)
+    entry = cache.get(md_file) if cache is not None else None
+    if (entry and entry.get("key") == key and os.path.exists(output_pdf)
+            and all(diagram_cached(block) for block in blocks or ())):
+        print(f"Up to date: {output_pdf}")
+        return True, True, entry.get("seconds", 0.0)
+    
+    print(f"Converting {md_file} to {output_pdf} ({backend.name})...")
+    start = time.perf_counter()
+    if blocks:
+        rendered = render_diagrams(blocks)
+        print(f"{md_file}: {len(blocks)} diagrams ({rendered} rendered, "
+              f"{len(blocks) - rendered} cached)")
+    success = backend.convert(md_file, md_content, output_pdf, f"{temp_dir}/{temp_name}")
+    elapsed = time.perf_counter() - start
+    if cache is not None:
+        if success:
+            cache[md_file] = {"key": key, "output": output_pdf, "seconds": round(elapsed, 3)}
+        else:
+            cache.pop(md_file, None)
+    return success, False, elapsed
 
-# Create pdfs directory if it doesn't exist
-os.makedirs("pdfs", exist_ok=True)
 
 # Files to convert
 files_to_convert = [
@@ -90,25 +556,223 @@ files_to_convert = [
     ("hardware_design/circuit_implementation.md", "pdfs/circuit_implementation.pdf")
 ]
 
-# Convert each file
-results = []
-for md_file, output_pdf in files_to_convert:
+# Files and directories polled by --watch
+WATCH_PATHS = ["README.md", "docs", "hardware_design"]
+
+
+def convert_timed(md_file, output_pdf, cache, backend, diagrams=True):
+    """Convert one document and measure its wall time"""
+    start = time.perf_counter()
     if os.path.exists(md_file):
-        success = convert_md_to_pdf(md_file, output_pdf)
-        results.append((md_file, success))
+        success, cached, seconds = convert_md_to_pdf(md_file, output_pdf, cache, backend, diagrams)
     else:
         print(f"Error: File not found - {md_file}")
-        results.append((md_file, False))
-
-# Print summary
-print("\nConversion Summary:")
-for md_file, success in results:
-    status = "Success" if success else "Failed"
-    print(f"{md_file}: {status}")
-
-print("\nPDFs in output directory:")
-for f in os.listdir("pdfs"):
-    if f.endswith(".pdf"):
-        pdf_path = os.path.join("pdfs", f)
-        file_size = os.path.getsize(pdf_path) / 1024  # in KB
-        print(f"{f} ({file_size:.1f} KB)") 
\ No newline at end of file
+        success, cached, seconds = False, False, 0.0
+    return md_file, success, cached, seconds, time.perf_counter() - start
+
+
+def convert_in_worker(md_file, output_pdf, entry, backend_name, diagrams=True):
+    """
+    Process-pool task: convert one document with the worker's own backend
+    
+    Args:
+        entry (dict): The document's build cache entry, or None without a cache
+    
+    Returns:
+        tuple: (convert_timed result, updated cache entry or None)
+    """
+    cache = None if entry is None else ({md_file: entry} if entry else {})
+    result = convert_timed(md_file, output_pdf, cache, get_backend(backend_name), diagrams)
+    return result, cache.get(md_file) if cache is not None else None
+
+
+def convert_all(files, backend, cache, jobs=4, diagrams=True):
+    """
+    Convert documents, up to `jobs` at a time
+    
+    Subprocess backends mostly wait on their tools, so a thread pool
+    overlaps them; each worker updates only its own cache entry. In-process
+    backends that are not thread-safe get a process pool instead, and the
+    workers' cache entries are merged back. A single document is converted
+    in this process with the already-warm backend.
+    
+    Returns:
+        tuple: (list of convert_timed results, total wall time)
+    """
+    jobs = max(1, min(jobs, len(files)))
+    start = time.perf_counter()
+    if backend.parallel or jobs == 1:
+        with ThreadPoolExecutor(max_workers=jobs if backend.parallel else 1) as pool:
+            futures = [pool.submit(convert_timed, md_file, output_pdf, cache, backend, diagrams)
+                       for md_file, output_pdf in files]
+            results = [future.result() for future in futures]
+        return results, time.perf_counter() - start
+    
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(convert_in_worker, md_file, output_pdf,
+                               None if cache is None else cache.get(md_file, {}),
+                               backend.name, diagrams)
+                   for md_file, output_pdf in files]
+        results = []
+        for (md_file, _), future in zip(files, futures):
+            result, entry = future.result()
+            results.append(result)
+            if cache is not None:
+                if entry:
+                    cache[md_file] = entry
+                else:
+                    cache.pop(md_file, None)
+    return results, time.perf_counter() - start
+
+
+def scan_mtimes(paths=WATCH_PATHS):
+    """Map every markdown file under the watched paths to its mtime"""
+    mtimes = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in names:
+                    if name.endswith('.md'):
+                        full = os.path.join(root, name)
+                        try:
+                            mtimes[os.path.normpath(full)] = os.stat(full).st_mtime_ns
+                        except OSError:
+                            pass
+        else:
+            try:
+                mtimes[os.path.normpath(path)] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+    return mtimes
+
+
+def watch(files, backend, cache, jobs=4, diagrams=True, interval=0.5, debounce=0.3):
+    """
+    Poll the watched paths and reconvert documents when they change
+    
+    Bursts of saves are collected until nothing has changed for debounce
+    seconds. Only the changed documents are converted, with the same warm
+    backend (parser, stylesheet, fonts) and build cache every time. A
+    rebuild that fails is reported and watching continues. Runs until
+    interrupted.
+    """
+    targets = {os.path.normpath(md_file): (md_file, output_pdf) for md_file, output_pdf in files}
+    print(f"Watching {', '.join(WATCH_PATHS)} (Ctrl+C to stop)")
+    mtimes = scan_mtimes()
+    try:
+        while True:
+            time.sleep(interval)
+            current = scan_mtimes()
+            if current == mtimes:
+                continue
+            # Debounce: keep collecting changes until the tree is quiet
+            changed = set()
+            while current != mtimes:
+                changed |= {path for path in current.keys() | mtimes.keys()
+                            if current.get(path) != mtimes.get(path)}
+                mtimes = current
+                time.sleep(debounce)
+                current = scan_mtimes()
+            todo = [targets[path] for path in sorted(changed) if path in targets and path in current]
+            if not todo:
+                continue
+            try:
+                results, total = convert_all(todo, backend, cache, jobs, diagrams)
+                save_cache(cache)
+            except Exception as e:
+                # e.g. a document deleted or renamed mid-rebuild: report it
+                # and keep watching
+                print(f"Rebuild failed: {type(e).__name__}: {e}")
+                continue
+            for md_file, success, cached, _, wall in results:
+                status = "unchanged" if cached else ("rebuilt" if success else "FAILED")
+                print(f"{md_file}: {status} ({wall:.2f} s)")
+            print(f"Rebuild finished in {total:.2f} s")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def benchmark(files, jobs=4):
+    """Convert every document with each available backend and compare times"""
+    print("Backend benchmark (cache disabled):")
+    for name in BACKENDS:
+        try:
+            start = time.perf_counter()
+            backend = get_backend(name)
+            setup = time.perf_counter() - start
+        except (ImportError, OSError) as e:
+            print(f"  {name:<11} unavailable ({e})")
+            continue
+        with tempfile.TemporaryDirectory() as out_dir:
+            targets = [(md_file, os.path.join(out_dir, os.path.basename(pdf)))
+                       for md_file, pdf in files]
+            results, total = convert_all(targets, backend, None, jobs)
+        ok = sum(1 for r in results if r[1])
+        per_doc = ", ".join(f"{os.path.basename(r[0])} {r[4]:.2f} s" for r in results)
+        print(f"  {name:<11} setup {setup:.2f} s, total {total:.2f} s "
+              f"({ok}/{len(results)} ok): {per_doc}")
+
+
+def main(argv=None):
+    """Convert every document, skipping unchanged ones"""
+    parser = argparse.ArgumentParser(description="Convert the project documentation to PDF")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="weasyprint",
+                        help="renderer (default: in-process weasyprint; pandoc uses xelatex)")
+    parser.add_argument("--force", action="store_true", help="ignore the build cache")
+    parser.add_argument("--jobs", type=int, default=4,
+                        help="documents converted at once: threads for pandoc, worker "
+                             "processes for weasyprint (default: 4)")
+    parser.add_argument("--no-diagrams", action="store_true",
+                        help="replace diagrams with notes / <pre> blocks instead of SVG images")
+    parser.add_argument("--watch", action="store_true",
+                        help="after converting, rebuild documents whenever they change")
+    parser.add_argument("--bench", action="store_true", help="compare the backends and exit")
+    parser.add_argument("--bench-preprocess", type=float, metavar="MB",
+                        help="measure preprocessor throughput on a synthetic MB-sized file and exit")
+    args = parser.parse_args(argv)
+    
+    if args.bench_preprocess:
+        bench_preprocess(args.bench_preprocess)
+        return 0
+    
+    if args.bench:
+        benchmark(files_to_convert, args.jobs)
+        return 0
+    
+    backend = choose_backend(args.backend)
+    if backend is None:
+        return 1
+    
+    # Create pdfs directory if it doesn't exist
+    os.makedirs("pdfs", exist_ok=True)
+    
+    cache = {} if args.force else load_cache()
+    results, total = convert_all(files_to_convert, backend, cache, args.jobs,
+                                 not args.no_diagrams)
+    save_cache(cache)
+    
+    # Print summary
+    print("\nConversion Summary:")
+    for md_file, success, cached, seconds, wall in results:
+        status = "Cached" if cached else ("Success" if success else "Failed")
+        print(f"{md_file}: {status} ({wall:.2f} s)")
+    hits = [seconds for _, _, cached, seconds, _ in results if cached]
+    print(f"Cache hits: {len(hits)}/{len(results)} (saved about {sum(hits):.1f} s)")
+    print(f"Total wall time: {total:.2f} s "
+          f"(sum of documents {sum(r[4] for r in results):.2f} s, {backend.name})")
+    
+    print("\nPDFs in output directory:")
+    for f in os.listdir("pdfs"):
+        if f.endswith(".pdf"):
+            pdf_path = os.path.join("pdfs", f)
+            file_size = os.path.getsize(pdf_path) / 1024  # in KB
+            print(f"{f} ({file_size:.1f} KB)")
+    
+    if args.watch:
+        watch(files_to_convert, backend, cache, args.jobs, not args.no_diagrams)
+        return 0
+    return 0 if all(r[1] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Adder Architectures
+This module compares the adder structures of the gate-level netlist:
+- Ripple-carry, carry-lookahead (4-bit blocks), Kogge-Stone and Brent-Kung
+- Word-level models that compute the same carry networks with shifts and
+  masks on whole operands (Python ints or NumPy uint64 arrays of operands)
+- A benchmark of gate count, logic depth, critical-path delay and
+  throughput for 2 to 64 bits
+"""
+
+import argparse
+import sys
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from alu_netlist import ADDER_ARCHITECTURES, build_adder
+from alu_timing import critical_path
+from alu_verify import ALL_ONES, pack_bits, unpack_bits
+
+
+@lru_cache(maxsize=None)
+def _sweep_masks(width, block=4):
+    """
+    Bit masks of the positions each stage of a carry network updates
+
+    Returns:
+        dict: "kogge-stone": [(d, mask)], "brent-kung": [(d, mask)],
+        "lookahead": [(d, mask)] for the in-block stages plus the block size
+    """
+    def positions(indices):
+        return sum(1 << i for i in indices)
+
+    full = (1 << width) - 1
+    masks = {"kogge-stone": [], "brent-kung": [], "lookahead": []}
+    d = 1
+    while d < width:
+        masks["kogge-stone"].append((d, full & ~((1 << d) - 1)))
+        masks["brent-kung"].append((d, positions(range(2 * d - 1, width, 2 * d))))
+        masks["lookahead"].append((d, positions(i for i in range(width) if i % block >= d)))
+        d *= 2
+    while d > 1:
+        d //= 2
+        masks["brent-kung"].append((d, positions(range(3 * d - 1, width, 2 * d))))
+    masks["lookahead"] = [(d, m) for d, m in masks["lookahead"] if d < block and m]
+    return masks
+
+
+def add_words(a, b, carry_in=0, width=64, architecture="kogge-stone", block=4):
+    """
+    Add two operands with the carry network of an adder architecture
+
+    Every stage of the network is one shift/AND/OR step over whole words,
+    so the number of steps equals the logic depth of the carry chain.
+    Works on Python ints and, elementwise, on NumPy uint64 arrays.
+
+    Args:
+        a, b: Operands (ints, or uint64 arrays for width <= 64)
+        carry_in: 0 or 1 (or an array of 0/1 values)
+        width (int): Operand width in bits
+        architecture (str): One of ADDER_ARCHITECTURES
+
+    Returns:
+        tuple: (sum, carry_out)
+    """
+    if isinstance(a, np.ndarray):
+        const = np.uint64
+        carry_in = np.asarray(carry_in, dtype=np.uint64)
+    else:
+        const = int
+    full = const((1 << width) - 1)
+    one = const(1)
+    g = a & b
+    p = a ^ b
+
+    if architecture == "ripple":
+        # One step per bit: each carry waits for the one below it
+        carries = g | (p & carry_in)
+        for _ in range(width - 1):
+            carries = g | (p & ((carries << one) | carry_in))
+        carries &= full
+    elif architecture in ("kogge-stone", "brent-kung"):
+        # Prefix network over (G, P); the carry-in joins through bit 0
+        gen = g | (p & carry_in)
+        prop = p
+        for d, mask in _sweep_masks(width)[architecture]:
+            shift, mask = const(d), const(mask)
+            gen = gen | (prop & (gen << shift) & mask)
+            prop = (prop & ~mask) | (prop & (prop << shift) & mask)
+        carries = gen & full
+    elif architecture == "lookahead":
+        # Group generate/propagate inside each block, then ripple the block
+        # carries from block to block
+        gen, prop = g, p
+        for d, mask in _sweep_masks(width, block)["lookahead"]:
+            shift, mask = const(d), const(mask)
+            gen = gen | (prop & (gen << shift) & mask)
+            prop = (prop & ~mask) | (prop & (prop << shift) & mask)
+        carries = g & 0
+        block_carry = carry_in
+        for start in range(0, width, block):
+            span = const(((1 << min(block, width - start)) - 1) << start)
+            spread = (const(0) - block_carry) & span
+            carries = carries | ((gen | (prop & spread)) & span)
+            block_carry = (carries >> const(min(start + block, width) - 1)) & one
+    else:
+        raise ValueError(f"Unknown adder architecture: {architecture}")
+
+    total = (p ^ ((carries << one) | carry_in)) & full
+    return total, (carries >> const(width - 1)) & one
+
+
+def bench_words(width, architecture, count=1 << 16, rounds=5):
+    """
+    Word-level throughput on uint64 operand arrays
+
+    Returns:
+        float: Additions per second (best of rounds)
+    """
+    rng = np.random.default_rng(width)
+    top = (1 << width) - 1
+    a = rng.integers(0, top, count, dtype=np.uint64, endpoint=True)
+    b = rng.integers(0, top, count, dtype=np.uint64, endpoint=True)
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        add_words(a, b, 0, width, architecture)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def bench_gates(net, width, count=1 << 14, rounds=3):
+    """
+    Gate-level throughput of the compiled netlist, 64 additions per word
+
+    Returns:
+        float: Additions per second (best of rounds)
+    """
+    rng = np.random.default_rng(width)
+    top = (1 << width) - 1
+    a = rng.integers(0, top, count, dtype=np.uint64, endpoint=True)
+    b = rng.integers(0, top, count, dtype=np.uint64, endpoint=True)
+    planes = ([pack_bits(a, i) for i in range(width)] + [pack_bits(b, i) for i in range(width)]
+              + [np.zeros(count // 64, dtype=np.uint64)])
+    evaluate = net.compile()
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        evaluate(*planes, ALL_ONES)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def check_adders(widths=(2, 3, 8, 13, 64), count=2000):
+    """
+    Check every architecture's netlist and word model against native addition
+
+    Returns:
+        list: (architecture, width, model) for each failing combination
+    """
+    failures = []
+    rng = np.random.default_rng(0)
+    for width in widths:
+        top = (1 << width) - 1
+        a = rng.integers(0, top, count, dtype=np.uint64, endpoint=True)
+        b = rng.integers(0, top, count, dtype=np.uint64, endpoint=True)
+        cin = rng.integers(0, 1, count, dtype=np.uint64, endpoint=True)
+        expected = [int(x) + int(y) + int(c) for x, y, c in zip(a, b, cin)]
+        for architecture in ADDER_ARCHITECTURES:
+            total, carry = add_words(a, b, cin, width, architecture)
+            words = [int(s) | int(c) << width for s, c in zip(total, carry)]
+            if words != expected:
+                failures.append((architecture, width, "words"))
+            ints = [sum(add_words(int(x), int(y), int(c), width, architecture)[k] << (width * k)
+                        for k in (0, 1)) for x, y, c in zip(a[:50], b[:50], cin[:50])]
+            if ints != expected[:50]:
+                failures.append((architecture, width, "ints"))
+            pad = -count % 64
+            planes = ([pack_bits(np.concatenate([a, np.zeros(pad, np.uint64)]), i) for i in range(width)]
+                      + [pack_bits(np.concatenate([b, np.zeros(pad, np.uint64)]), i) for i in range(width)]
+                      + [pack_bits(np.concatenate([cin, np.zeros(pad, np.uint64)]), 0)])
+            outputs = build_adder(width, architecture).compile()(*planes, ALL_ONES)
+            gates = [sum(int(bit) << i for i, bit in enumerate(column))
+                     for column in zip(*(unpack_bits(o, count) for o in outputs))]
+            if gates != expected:
+                failures.append((architecture, width, "gates"))
+    return failures
+
+
+def main(argv=None):
+    """Compare the adder architectures"""
+    parser = argparse.ArgumentParser(description="Compare adder architectures for 2 to 64 bits")
+    parser.add_argument("--widths", type=int, nargs="+", default=[2, 4, 8, 16, 32, 64],
+                        help="operand widths (default: 2 4 8 16 32 64)")
+    parser.add_argument("--check", action="store_true",
+                        help="check every model against native addition first")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        failures = check_adders()
+        print("Adder models: " + ("OK" if not failures else f"FAILED {failures}"))
+        if failures:
+            return 1
+
+    print("Width  Adder        Gates  Depth  Critical (ns)  Gate-level (adds/s)  Word-level (adds/s)")
+    print("-" * 91)
+    for width in args.widths:
+        for architecture in ADDER_ARCHITECTURES:
+            net = build_adder(width, architecture)
+            depth = len(net.levelize())
+            delay, _ = critical_path(net)
+            gate_rate = bench_gates(net, width)
+            word_rate = bench_words(width, architecture)
+            print(f"{width:>5}  {architecture:<11} {len(net.gates):>6}  {depth:>5}  {delay:>13}  "
+                  f"{gate_rate:>19,.0f}  {word_rate:>19,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
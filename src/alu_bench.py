@@ -0,0 +1,163 @@
+"""
+2-Bit ALU Benchmarks
+This module measures the throughput of the ALU execution paths:
+- Dictionary dispatch (ALU.execute)
+- Precomputed lookup table (LookupALU.execute)
+- Vectorized batches (ALU.execute_batch)
+- N-bit ALUs at several widths (NBitALU)
+- Instruction execution on the tiny CPU model (alu_cpu)
+- Instrumentation overhead (alu_instrument)
+"""
+
+import time
+from alu_simulator import ALU, LookupALU, make_alu
+
+
+def _all_vectors():
+    """Return every valid (op_code, a, b) triple"""
+    ops = [ALU.AND, ALU.OR, ALU.XOR, ALU.ADD, ALU.SUB, ALU.NOT]
+    return [(op, a, b) for op in ops for a in range(4) for b in range(4)]
+
+
+def bench_execute(alu, rounds=20000):
+    """
+    Measure calls per second of alu.execute over all 96 input vectors
+
+    Args:
+        alu: ALU instance to benchmark
+        rounds (int): Number of passes over the full vector set
+
+    Returns:
+        float: Calls per second
+    """
+    vectors = _all_vectors()
+    execute = alu.execute
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for op, a, b in vectors:
+            execute(op, a, b)
+    elapsed = time.perf_counter() - start
+    return rounds * len(vectors) / elapsed
+
+
+def bench_dispatch(rounds=20000):
+    """Compare the dispatch path with the lookup-table path"""
+    results = [
+        ("dispatch", bench_execute(ALU(), rounds)),
+        ("lookup", bench_execute(LookupALU(), rounds)),
+    ]
+    base = results[0][1]
+    print("Execution path    Calls/s       Speedup")
+    print("-" * 40)
+    for name, rate in results:
+        print(f"{name:<16}  {rate:>12,.0f}  {rate / base:>6.2f}x")
+    return results
+
+
+def bench_batch(size=1_000_000, rounds=10):
+    """
+    Measure operations per second of ALU.execute_batch
+
+    Random operand arrays are generated once and the same output arrays
+    are reused for every round.
+
+    Returns:
+        float: Operations per second
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    ops = rng.integers(0, 6, size, dtype=np.uint8)
+    a = rng.integers(0, 4, size, dtype=np.uint8)
+    b = rng.integers(0, 4, size, dtype=np.uint8)
+    out = (np.empty(size, dtype=np.uint8), np.empty(size, dtype=np.uint8))
+
+    alu = ALU()
+    alu.execute_batch(ops, a, b, out=out)  # warm up the tables
+    start = time.perf_counter()
+    for _ in range(rounds):
+        alu.execute_batch(ops, a, b, out=out)
+    rate = size * rounds / (time.perf_counter() - start)
+    print(f"{'batch':<16}  {rate:>12,.0f}")
+    return rate
+
+
+def bench_widths(widths=(2, 8, 16, 32, 64), count=20000, batch_size=1_000_000):
+    """
+    Measure scalar and batch throughput of the ALU at each width
+
+    Returns:
+        list: (width, scalar ops/s, batch ops/s) rows
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    ops = rng.integers(0, 6, batch_size, dtype=np.uint8)
+    rows = []
+    print("Width   Scalar ops/s    Batch ops/s")
+    print("-" * 40)
+    for width in widths:
+        alu = make_alu(width)
+        top = (1 << width) - 1
+        a = rng.integers(0, top, batch_size, dtype=np.uint64, endpoint=True)
+        b = rng.integers(0, top, batch_size, dtype=np.uint64, endpoint=True)
+
+        vectors = list(zip(ops[:count].tolist(), a[:count].tolist(), b[:count].tolist()))
+        execute = alu.execute
+        start = time.perf_counter()
+        for op, x, y in vectors:
+            execute(op, x, y)
+        scalar = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        alu.execute_batch(ops, a, b)
+        batch = batch_size / (time.perf_counter() - start)
+
+        rows.append((width, scalar, batch))
+        print(f"{width:>5}  {scalar:>13,.0f}  {batch:>13,.0f}")
+    return rows
+
+
+def bench_instrumentation(rounds=10000):
+    """
+    Compare execute throughput of a plain ALU, the same ALU wrapped with
+    instrumentation, and the ALU after unwrapping
+
+    Returns:
+        list: (label, calls/s) rows
+    """
+    from alu_instrument import Instrumentation
+
+    def best(alu):
+        # Best of three runs to damp scheduler noise
+        return max(bench_execute(alu, rounds) for _ in range(3))
+
+    alu = LookupALU()
+    rows = [("plain", best(alu))]
+    wrapped = Instrumentation().wrap(alu)
+    rows.append(("instrumented", best(wrapped)))
+    rows.append(("unwrapped", best(wrapped.unwrap())))
+
+    base = rows[0][1]
+    print("Instrumentation   Calls/s       Relative")
+    print("-" * 40)
+    for name, rate in rows:
+        print(f"{name:<16}  {rate:>12,.0f}  {rate / base:>6.2f}x")
+    return rows
+
+
+def main():
+    """Run all benchmarks"""
+    bench_dispatch()
+    bench_batch()
+    print()
+    bench_widths()
+    print()
+    from alu_cpu import bench_cpu
+    bench_cpu()
+    print()
+    bench_instrumentation()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+ALU Artifact Cache
+This module keeps derived ALU artifacts between runs:
+- Artifacts are keyed by ALU configuration (width, opcode set, adder type)
+  and a code version taken from the size and mtime of the modules that
+  generate them
+- Each artifact is one compact binary file (a small header followed by a
+  typed array or marshalled bytecode) that is memory-mapped back in
+- A bounded in-memory LRU sits in front of the files, and the directory is
+  pruned least recently used first when it grows past its size limit
+
+The cache directory is $ALU_CACHE_DIR (default ~/.cache/alu-simulator);
+setting ALU_CACHE_DIR to an empty string keeps artifacts in memory only.
+"""
+
+import array
+import marshal
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import OrderedDict
+
+# Modules whose source determines the cached artifacts
+SOURCES = ("alu_cache.py", "alu_simulator.py", "alu_netlist.py", "alu_circuit.py", "alu_render.py")
+
+# File header: magic, format version, typecode ("M" = marshalled code), item count
+HEADER = struct.Struct("<4sBc2xQ")
+MAGIC = b"ALUC"
+FORMAT = 1
+SUFFIX = ".bin"
+TEMP_SUFFIX = ".tmp"
+
+# Temporary files older than this are left over from an interrupted write
+STALE_TEMP_SECONDS = 600
+
+_version = None
+_default = None
+
+
+def code_version():
+    """
+    Version tag of the generating modules and the interpreter's bytecode
+
+    Computed on first use from each source file's size and mtime, which
+    costs a few stat calls instead of reading and hashing the sources.
+    """
+    global _version
+    if _version is None:
+        here = os.path.dirname(os.path.abspath(__file__))
+        stamps = [sys.implementation.cache_tag]
+        for name in SOURCES:
+            info = os.stat(os.path.join(here, name))
+            stamps.append(f"{info.st_size}:{info.st_mtime_ns}")
+        _version = f"{zlib.crc32(' '.join(stamps).encode()):08x}"
+    return _version
+
+
+def artifact_key(kind, width=2, opcodes=(), adder=None):
+    """
+    Cache key for an artifact of one ALU configuration
+
+    Args:
+        kind (str): Artifact name, e.g. "alu-netlist"
+        width (int): Operand width in bits
+        opcodes (iterable): Operation codes the ALU implements
+        adder (str): Adder architecture, for artifacts that depend on it
+
+    Returns:
+        str: Key usable as a file name
+    """
+    ops = sum(1 << op for op in opcodes)
+    parts = [kind, f"w{width}", f"op{ops:x}"] + ([adder] if adder else []) + [code_version()]
+    return "-".join(parts)
+
+
+class ArtifactCache:
+    """Two-level cache: in-memory LRU in front of memory-mapped files"""
+
+    def __init__(self, directory=None, max_bytes=16 << 20, max_disk_bytes=64 << 20):
+        """
+        Args:
+            directory (str): Cache directory (None keeps artifacts in memory only)
+            max_bytes (int): Memory budget of the LRU layer
+            max_disk_bytes (int): Size limit of the cache directory
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.stats = {"memory": 0, "disk": 0, "miss": 0, "evicted": 0}
+
+    def path(self, key):
+        """File holding the artifact for key"""
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key):
+        """
+        Look up an artifact in memory, then on disk
+
+        Returns:
+            The artifact (a typed memoryview or a code object), or None
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.stats["memory"] += 1
+            return self.entries[key][0]
+        value = self._load(key) if self.directory else None
+        if value is None:
+            return None
+        self.stats["disk"] += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        """
+        Store an artifact: an array.array, bytes, or a code object
+
+        Returns:
+            The value as get() will return it
+        """
+        if isinstance(value, bytes):
+            value = array.array("B", value)
+        if self.directory:
+            try:
+                self._store(key, value)
+            except OSError:
+                pass  # read-only or full disk: keep the artifact in memory only
+        if isinstance(value, array.array):
+            value = memoryview(value)
+        self._remember(key, value)
+        return value
+
+    def fetch(self, key, build):
+        """Return the artifact for key, calling build() and storing the result on a miss"""
+        value = self.get(key)
+        if value is None:
+            self.stats["miss"] += 1
+            value = self.put(key, build())
+        return value
+
+    def clear(self):
+        """Drop every artifact from memory and disk"""
+        self.entries.clear()
+        self.size = 0
+        for name, _, _ in self._files():
+            os.remove(os.path.join(self.directory, name))
+
+    def _remember(self, key, value):
+        """Insert into the LRU layer, evicting the least recently used entries"""
+        size = value.nbytes if isinstance(value, memoryview) else len(marshal.dumps(value))
+        if key in self.entries:
+            self.size -= self.entries.pop(key)[1]
+        self.entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= evicted
+            self.stats["evicted"] += 1
+
+    def _load(self, key):
+        """Memory-map an artifact file, or return None if it is missing or damaged"""
+        try:
+            with open(self.path(key), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            os.utime(self.path(key))  # mark as recently used for pruning
+        except (OSError, ValueError):
+            return None
+        if len(mapped) < HEADER.size or mapped[:len(MAGIC)] != MAGIC:
+            mapped.close()
+            return None
+        _, version, typecode, count = HEADER.unpack_from(mapped)
+        if version != FORMAT:
+            mapped.close()
+            return None
+        if typecode == b"M":
+            try:
+                return marshal.loads(mapped[HEADER.size:])
+            except (EOFError, ValueError, TypeError):
+                return None
+            finally:
+                mapped.close()
+        if len(mapped) - HEADER.size != count * array.array(typecode.decode()).itemsize:
+            mapped.close()
+            return None
+        return memoryview(mapped)[HEADER.size:].cast(typecode.decode())
+
+    def _store(self, key, value):
+        """Write an artifact file atomically, then prune the directory"""
+        import tempfile
+
+        if isinstance(value, array.array):
+            header = HEADER.pack(MAGIC, FORMAT, value.typecode.encode(), len(value))
+            payload = value.tobytes()
+        else:
+            payload = marshal.dumps(value)
+            header = HEADER.pack(MAGIC, FORMAT, b"M", len(payload))
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header + payload)
+            os.replace(temp, self.path(key))
+        except OSError:
+            os.unlink(temp)
+            raise
+        self.prune()
+
+    def _files(self):
+        """(name, size, mtime) of every artifact file, least recently used first"""
+        if not self.directory or not os.path.isdir(self.directory):
+            return []
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SUFFIX):
+                info = entry.stat()
+                files.append((entry.name, info.st_size, info.st_mtime))
+        return sorted(files, key=lambda item: item[2])
+
+    def _stale_temps(self):
+        """Temporary files left behind by writes that never reached os.replace"""
+        if not self.directory or not os.path.isdir(self.directory):
+            return []
+        cutoff = time.time() - STALE_TEMP_SECONDS
+        return [entry.name for entry in os.scandir(self.directory)
+                if entry.name.endswith(TEMP_SUFFIX) and entry.stat().st_mtime < cutoff]
+
+    def prune(self):
+        """Delete stale temporary files, then least recently used artifacts over the limit"""
+        for name in self._stale_temps():
+            os.remove(os.path.join(self.directory, name))
+        files = self._files()
+        total = sum(size for _, size, _ in files)
+        for name, size, _ in files:
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+
+def default_directory():
+    """Cache directory from $ALU_CACHE_DIR, or None when caching to disk is disabled"""
+    directory = os.environ.get("ALU_CACHE_DIR")
+    if directory is None:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        directory = os.path.join(base, "alu-simulator")
+    return directory or None
+
+
+def default_cache():
+    """The process-wide artifact cache"""
+    global _default
+    if _default is None:
+        _default = ArtifactCache(default_directory())
+    return _default
+
+
+def main(argv=None):
+    """Command-line entry point to inspect or clear the cache"""
+    # argparse and tempfile are imported on use: every netlist compile
+    # loads this module, and cache hits need neither
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the ALU artifact cache")
+    parser.add_argument("--clear", action="store_true", help="delete every cached artifact")
+    args = parser.parse_args(argv)
+
+    cache = default_cache()
+    if cache.directory is None:
+        print("Disk cache disabled (ALU_CACHE_DIR is empty)")
+        return 0
+    if args.clear:
+        cache.clear()
+        print(f"Cleared {cache.directory}")
+        return 0
+    files = cache._files()
+    print(f"{cache.directory}: {len(files)} artifacts, "
+          f"{sum(size for _, size, _ in files):,} bytes (limit {cache.max_disk_bytes:,})")
+    version = code_version()
+    for name, size, _ in reversed(files):
+        state = "" if name.endswith(version + SUFFIX) else "  (stale)"
+        print(f"  {name:<48} {size:>10,}{state}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+"""
+ALU Circuit Layout
+This module draws the ALU's gate-level circuits on any canvas that
+implements the Tk canvas item API:
+- LogicGate draws one gate symbol with its input and output wires
+- CircuitView lays out the circuit of every operation and updates the
+  wire colors and output LEDs as the inputs change
+
+It does not import tkinter, so the layout also runs without a display
+(see alu_render.py).
+"""
+
+from alu_netlist import VCC, IncrementalSimulator, Netlist
+
+
+class LogicGate:
+    """Represents a logic gate for drawing"""
+    def __init__(self, canvas, x, y, gate_type, inputs=None, label=""):
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.type = gate_type
+        self.inputs = inputs or []
+        self.label = label
+        self.width = 60
+        self.height = 40
+        self.output_x = x + self.width
+        self.output_y = y + self.height/2
+        self.items = []
+        self.input_wires = []
+        self.output_wire = None
+    
+    def draw(self, tags=()):
+        """
+        Draw the logic gate on the canvas
+        
+        Every item is created with the given tags. The ids of the created
+        items are kept in self.items, and the wire ids in self.input_wires
+        and self.output_wire so they can be recolored later.
+        """
+        canvas = self.canvas
+        items = self.items
+        if self.type == "AND":
+            # Draw AND gate
+            items.append(canvas.create_rectangle(self.x, self.y, self.x + self.width*0.7, self.y + self.height, tags=tags))
+            items.append(canvas.create_arc(
+                self.x + self.width*0.2, self.y,
+                self.x + self.width*1.1, self.y + self.height,
+                start=270, extent=180, style="chord", tags=tags
+            ))
+        elif self.type == "OR":
+            # Draw OR gate
+            items.append(canvas.create_arc(
+                self.x - self.width*0.2, self.y,
+                self.x + self.width*0.7, self.y + self.height,
+                start=270, extent=180, style="chord", tags=tags
+            ))
+            items.append(canvas.create_arc(
+                self.x - self.width*0.1, self.y,
+                self.x + self.width*0.8, self.y + self.height,
+                start=270, extent=180, style="chord", tags=tags
+            ))
+        elif self.type == "XOR":
+            # Draw XOR gate (OR with extra curve)
+            items.append(canvas.create_arc(
+                self.x - self.width*0.2, self.y,
+                self.x + self.width*0.7, self.y + self.height,
+                start=270, extent=180, style="chord", tags=tags
+            ))
+            items.append(canvas.create_arc(
+                self.x - self.width*0.1, self.y,
+                self.x + self.width*0.8, self.y + self.height,
+                start=270, extent=180, style="chord", tags=tags
+            ))
+            items.append(canvas.create_arc(
+                self.x - self.width*0.3, self.y,
+                self.x + self.width*0.6, self.y + self.height,
+                start=270, extent=180, style="arc", tags=tags
+            ))
+        elif self.type == "NOT":
+            # Draw NOT gate
+            items.append(canvas.create_polygon(
+                self.x, self.y,
+                self.x, self.y + self.height,
+                self.x + self.width*0.7, self.y + self.height/2,
+                tags=tags
+            ))
+            items.append(canvas.create_oval(
+                self.x + self.width*0.7, self.y + self.height/2 - 5,
+                self.x + self.width*0.7 + 10, self.y + self.height/2 + 5,
+                tags=tags
+            ))
+        
+        # Draw label
+        items.append(canvas.create_text(self.x + self.width/2, self.y - 10, text=self.label, tags=tags))
+        
+        # Draw output line
+        self.output_wire = canvas.create_line(
+            self.output_x, self.output_y,
+            self.output_x + 30, self.output_y,
+            tags=tags
+        )
+        items.append(self.output_wire)
+        
+        # Draw input lines
+        input_spacing = self.height / (len(self.inputs) + 1)
+        for i, input_label in enumerate(self.inputs):
+            input_y = self.y + input_spacing * (i + 1)
+            wire = canvas.create_line(self.x - 30, input_y, self.x, input_y, tags=tags)
+            self.input_wires.append(wire)
+            items.append(wire)
+            items.append(canvas.create_text(self.x - 40, input_y, text=input_label, tags=tags))
+
+
+class CircuitView:
+    """
+    Retained-mode drawing of the ALU circuits on a canvas
+    
+    Each operation's circuit is drawn once under its own tag and then
+    shown or hidden; input values, output LEDs and the title are updated
+    in place with itemconfig. The canvas only needs the Tk canvas item
+    API, so the same layout code can drive other canvas backends.
+    
+    Every drawn gate is also added to a per-operation netlist. Wires are
+    colored by the logic level of their net, and an input change only
+    re-evaluates (and recolors) the nets downstream of it.
+    """
+    
+    HIGH_COLOR = "red"
+    LOW_COLOR = "gray"
+    INPUT_NETS = ["A0", "A1", "B0", "B1"]
+    
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.circuits = {}
+        self.current_op = None
+        self.items = {}
+        self.values = {}
+        self._netlist = None
+        self._wires = None
+    
+    def show(self, op_name, a_val, b_val, result, carry):
+        """Display the circuit for op_name with the given values"""
+        if not self.items:
+            self.draw_static()
+        
+        if op_name != self.current_op:
+            if self.current_op is not None:
+                self.canvas.itemconfigure(self.circuits[self.current_op]["tag"], state="hidden")
+            if op_name not in self.circuits:
+                self.circuits[op_name] = self.draw_operation(op_name)
+            else:
+                self.canvas.itemconfigure(self.circuits[op_name]["tag"], state="normal")
+            self.current_op = op_name
+            self.set_item("title", text=f"2-Bit ALU: {op_name} Operation")
+        
+        self.update_signals(self.circuits[op_name], a_val, b_val)
+        self.update_values(a_val, b_val, result, carry)
+    
+    def set_item(self, key, **options):
+        """itemconfig a dynamic item, skipping the call if nothing changed"""
+        if self.values.get(key) != options:
+            self.canvas.itemconfigure(self.items[key], **options)
+            self.values[key] = options
+    
+    def draw_static(self):
+        """Draw the items shared by every operation"""
+        canvas = self.canvas
+        self.items["title"] = canvas.create_text(450, 30, text="", font=("Arial", 16))
+        
+        # Input bits
+        canvas.create_text(80, 80, text="Input A:", font=("Arial", 12))
+        self.items["a1"] = canvas.create_text(110, 110, text="")
+        self.items["a0"] = canvas.create_text(110, 140, text="")
+        
+        canvas.create_text(80, 180, text="Input B:", font=("Arial", 12))
+        self.items["b1"] = canvas.create_text(110, 210, text="")
+        self.items["b0"] = canvas.create_text(110, 240, text="")
+        
+        # Output LEDs
+        canvas.create_text(750, 100, text="Output:", font=("Arial", 12))
+        self.items["r1_led"] = canvas.create_oval(750, 130, 780, 160, fill="white", outline="black")
+        self.items["r1"] = canvas.create_text(790, 145, text="")
+        self.items["r0_led"] = canvas.create_oval(750, 180, 780, 210, fill="white", outline="black")
+        self.items["r0"] = canvas.create_text(790, 195, text="")
+        self.items["carry_led"] = canvas.create_oval(750, 230, 780, 260, fill="white", outline="black")
+        self.items["carry"] = canvas.create_text(790, 245, text="")
+    
+    def update_values(self, a_val, b_val, result, carry):
+        """Update the input texts and output LEDs in place"""
+        self.set_item("a1", text=f"A[1] = {a_val >> 1}")
+        self.set_item("a0", text=f"A[0] = {a_val & 1}")
+        self.set_item("b1", text=f"B[1] = {b_val >> 1}")
+        self.set_item("b0", text=f"B[0] = {b_val & 1}")
+        
+        self.set_item("r1_led", fill="red" if result & 2 else "white")
+        self.set_item("r1", text=f"Result[1] = {result >> 1}")
+        self.set_item("r0_led", fill="red" if result & 1 else "white")
+        self.set_item("r0", text=f"Result[0] = {result & 1}")
+        
+        # Carry/Borrow
+        carry_state = "hidden" if carry is None else "normal"
+        self.set_item("carry_led", fill="red" if carry else "white", state=carry_state)
+        self.set_item("carry", text=f"Carry/Borrow = {carry}", state=carry_state)
+    
+    def update_signals(self, circuit, a_val, b_val):
+        """Propagate new input bits through the circuit and recolor changed wires"""
+        simulator = circuit["simulator"]
+        changed = simulator.set_inputs({
+            "A0": a_val & 1, "A1": a_val >> 1,
+            "B0": b_val & 1, "B1": b_val >> 1,
+        })
+        if circuit.pop("fresh", False):
+            changed = circuit["wires"].keys()
+        values = simulator.values
+        for net in changed:
+            color = self.HIGH_COLOR if values[net] else self.LOW_COLOR
+            for item in circuit["wires"].get(net, ()):
+                self.canvas.itemconfigure(item, fill=color)
+    
+    def draw_operation(self, op_name):
+        """
+        Draw the circuit for one operation under its own tag
+        
+        Returns:
+            dict: The circuit's tag, wire items per net and net simulator
+        """
+        tag = f"op_{op_name}"
+        drawers = {
+            "AND": self.draw_and_circuit,
+            "OR": self.draw_or_circuit,
+            "XOR": self.draw_xor_circuit,
+            "ADD": self.draw_add_circuit,
+            "SUB": self.draw_sub_circuit,
+            "NOT": self.draw_not_circuit,
+        }
+        self._netlist = Netlist(self.INPUT_NETS)
+        self._wires = {}
+        drawers[op_name](tag)
+        return {
+            "tag": tag,
+            "wires": self._wires,
+            "simulator": IncrementalSimulator(self._netlist),
+            "fresh": True,
+        }
+    
+    def gate(self, tag, x, y, gate_type, inputs, label, nets, output):
+        """Draw a gate and add it to the circuit's netlist"""
+        gate = LogicGate(self.canvas, x, y, gate_type, inputs, label)
+        gate.draw(tag)
+        for wire, net in zip(gate.input_wires, nets):
+            self._wires.setdefault(net, []).append(wire)
+        self._wires.setdefault(output, []).append(gate.output_wire)
+        self._netlist.add_gate(gate_type, nets, output, label)
+        return gate
+    
+    def wire(self, tag, net, *coords):
+        """Draw a connecting line carrying the given net"""
+        item = self.canvas.create_line(*coords, tags=tag)
+        self._wires.setdefault(net, []).append(item)
+        return item
+    
+    def draw_and_circuit(self, tag):
+        """Draw the AND circuit"""
+        # Draw bit 1 AND gate
+        and1 = self.gate(tag, 350, 100, "AND", ["A[1]", "B[1]"], "AND1", ["A1", "B1"], "R1")
+        
+        # Draw bit 0 AND gate
+        and0 = self.gate(tag, 350, 200, "AND", ["A[0]", "B[0]"], "AND0", ["A0", "B0"], "R0")
+        
+        # Connect to outputs
+        self.wire(tag, "R1", and1.output_x + 30, and1.output_y, 750, 145)
+        self.wire(tag, "R0", and0.output_x + 30, and0.output_y, 750, 195)
+    
+    def draw_or_circuit(self, tag):
+        """Draw the OR circuit"""
+        # Draw bit 1 OR gate
+        or1 = self.gate(tag, 350, 100, "OR", ["A[1]", "B[1]"], "OR1", ["A1", "B1"], "R1")
+        
+        # Draw bit 0 OR gate
+        or0 = self.gate(tag, 350, 200, "OR", ["A[0]", "B[0]"], "OR0", ["A0", "B0"], "R0")
+        
+        # Connect to outputs
+        self.wire(tag, "R1", or1.output_x + 30, or1.output_y, 750, 145)
+        self.wire(tag, "R0", or0.output_x + 30, or0.output_y, 750, 195)
+    
+    def draw_xor_circuit(self, tag):
+        """Draw the XOR circuit"""
+        # Draw bit 1 XOR gate
+        xor1 = self.gate(tag, 350, 100, "XOR", ["A[1]", "B[1]"], "XOR1", ["A1", "B1"], "R1")
+        
+        # Draw bit 0 XOR gate
+        xor0 = self.gate(tag, 350, 200, "XOR", ["A[0]", "B[0]"], "XOR0", ["A0", "B0"], "R0")
+        
+        # Connect to outputs
+        self.wire(tag, "R1", xor1.output_x + 30, xor1.output_y, 750, 145)
+        self.wire(tag, "R0", xor0.output_x + 30, xor0.output_y, 750, 195)
+    
+    def draw_add_circuit(self, tag):
+        """Draw the ADD circuit (two half adders and a carry OR)"""
+        # Half adder for bit 0
+        ha1 = self.gate(tag, 250, 100, "XOR", ["A[0]", "B[0]"], "HA1-Sum", ["A0", "B0"], "R0")
+        ha2 = self.gate(tag, 250, 180, "AND", ["A[0]", "B[0]"], "HA1-Carry", ["A0", "B0"], "C0")
+        
+        # Half adder for bit 1
+        ha3 = self.gate(tag, 400, 100, "XOR", ["A[1]", "B[1]"], "HA2-Sum", ["A1", "B1"], "S1")
+        ha4 = self.gate(tag, 400, 180, "AND", ["A[1]", "B[1]"], "HA2-Carry", ["A1", "B1"], "G1")
+        
+        # Second half adder adds the carry from bit 0
+        ha5 = self.gate(tag, 550, 130, "XOR", ["HA2-Sum", "HA1-Carry"], "R[1]", ["S1", "C0"], "R1")
+        self.gate(tag, 400, 260, "AND", ["HA2-Sum", "HA1-Carry"], "Carry-Internal", ["S1", "C0"], "P1")
+        
+        or1 = self.gate(tag, 550, 230, "OR", ["HA2-Carry", "Carry-Internal"], "Carry", ["G1", "P1"], "CARRY")
+        
+        # Connect the gates
+        self.wire(tag, "R0", ha1.output_x + 30, ha1.output_y, 750, 195)  # R[0]
+        self.wire(tag, "C0", ha2.output_x + 30, ha2.output_y, 450, 150)
+        
+        self.wire(tag, "R1", ha5.output_x + 30, ha5.output_y, 750, 145)  # R[1]
+        self.wire(tag, "CARRY", or1.output_x + 30, or1.output_y, 750, 245)  # Carry
+    
+    def draw_sub_circuit(self, tag):
+        """Draw the SUB circuit (A + NOT(B) + 1 through a 2-bit adder)"""
+        # For subtraction, B is inverted and added to A with a carry-in of 1
+        self.gate(tag, 200, 80, "NOT", ["B[1]"], "NOT-B[1]", ["B1"], "NB1")
+        self.gate(tag, 200, 150, "NOT", ["B[0]"], "NOT-B[0]", ["B0"], "NB0")
+        
+        # Show simplified 2's complement logic
+        self.canvas.create_text(150, 270, text="2's Complement Logic", font=("Arial", 10), tags=tag)
+        self.canvas.create_text(150, 290, text="B' = NOT(B) + 1", font=("Arial", 8), tags=tag)
+        
+        # Bit 0: the carry-in of 1 is tied to +5V
+        self.gate(tag, 320, 150, "XOR", ["A[0]", "B'[0]"], "X0", ["A0", "NB0"], "X0")
+        ha0 = self.gate(tag, 440, 150, "XOR", ["X0", "1"], "R[0]", ["X0", VCC], "R0")
+        self.gate(tag, 320, 220, "OR", ["A[0]", "B'[0]"], "Carry[1]", ["A0", "NB0"], "C1")
+        
+        # Bit 1 full adder
+        self.gate(tag, 320, 80, "XOR", ["A[1]", "B'[1]"], "X1", ["A1", "NB1"], "X1")
+        ha1 = self.gate(tag, 440, 80, "XOR", ["X1", "Carry[1]"], "R[1]", ["X1", "C1"], "R1")
+        self.gate(tag, 320, 290, "AND", ["A[1]", "B'[1]"], "G1", ["A1", "NB1"], "G1")
+        self.gate(tag, 440, 220, "AND", ["X1", "Carry[1]"], "P1", ["X1", "C1"], "P1")
+        cout = self.gate(tag, 550, 250, "OR", ["G1", "P1"], "Carry-Out", ["G1", "P1"], "COUT")
+        
+        # No carry out means A < B: borrow
+        borrow_gate = self.gate(tag, 660, 250, "NOT", ["Carry-Out"], "Borrow", ["COUT"], "CARRY")
+        
+        # Connect to outputs
+        self.wire(tag, "R1", ha1.output_x + 30, ha1.output_y, 750, 145)
+        self.wire(tag, "R0", ha0.output_x + 30, ha0.output_y, 750, 195)
+        self.wire(tag, "COUT", cout.output_x + 30, cout.output_y, borrow_gate.x - 30, cout.output_y)
+        self.wire(tag, "CARRY", borrow_gate.output_x + 30, borrow_gate.output_y, 750, 245)
+    
+    def draw_not_circuit(self, tag):
+        """Draw the NOT circuit"""
+        # Draw bit 1 NOT gate
+        not1 = self.gate(tag, 350, 100, "NOT", ["A[1]"], "NOT1", ["A1"], "R1")
+        
+        # Draw bit 0 NOT gate
+        not0 = self.gate(tag, 350, 200, "NOT", ["A[0]"], "NOT0", ["A0"], "R0")
+        
+        # Connect to outputs
+        self.wire(tag, "R1", not1.output_x + 30, not1.output_y, 750, 145)
+        self.wire(tag, "R0", not0.output_x + 30, not0.output_y, 750, 195)
@@ -0,0 +1,221 @@
+"""
+Tiny CPU Model Built Around the 2-Bit ALU
+This module runs instruction streams on the ALU datapath:
+- Four 2-bit registers (r0-r3) and a carry/borrow flag
+- A compact 16-bit binary instruction format
+- Decoding once into a preallocated instruction list, then a tight
+  dispatch loop that reads results from the ALU lookup table
+"""
+
+import struct
+import sys
+import time
+
+from alu_simulator import ALU, LookupALU
+
+# Instruction word layout (16 bits, little-endian in program images):
+#   bits 0-2   opcode (ALU opcodes 0-5, LDI, BR)
+#   ALU ops:   bits 3-4 rd, bits 5-6 ra, bits 7-8 rb     rd = ra OP rb
+#   LDI:       bits 3-4 rd, bits 5-6 immediate           rd = imm
+#   BR:        bit 3 condition (0 always, 1 if carry),   pc = target
+#              bits 4-15 target address
+LDI = 0b110
+BR = 0b111
+
+MNEMONICS = {
+    "AND": ALU.AND,
+    "OR": ALU.OR,
+    "XOR": ALU.XOR,
+    "ADD": ALU.ADD,
+    "SUB": ALU.SUB,
+    "NOT": ALU.NOT,
+    "LDI": LDI,
+    "JMP": BR,
+    "JC": BR,
+}
+
+# Operands per mnemonic; the other ALU operations take rd, ra, rb
+OPERAND_COUNTS = {"NOT": 2, "LDI": 2, "JMP": 1, "JC": 1}
+
+
+def encode(op_code, rd=0, ra=0, rb=0, target=0, conditional=False):
+    """Encode one instruction as a 16-bit word"""
+    if op_code == BR:
+        if not 0 <= target < 4096:
+            raise ValueError(f"Branch target out of range: {target}")
+        return BR | (int(conditional) << 3) | (target << 4)
+    if not 0 <= op_code <= LDI:
+        raise ValueError(f"Invalid operation code: {op_code}")
+    if op_code == LDI and not 0 <= ra <= 3:
+        raise ValueError(f"Immediate out of range (0-3): {ra}")
+    for register in (rd, ra, rb):
+        if not 0 <= register <= 3:
+            raise ValueError(f"Invalid register: r{register}")
+    return op_code | (rd << 3) | (ra << 5) | (rb << 7)
+
+
+def assemble(source):
+    """
+    Assemble a small text program into a binary image
+
+    One instruction per line, e.g. ``ADD r0, r1, r2``, ``NOT r1, r1``,
+    ``LDI r0, 3``, ``JC done`` or ``JMP loop``. Labels end with a colon
+    and ``#`` starts a comment.
+
+    Returns:
+        bytes: Little-endian 16-bit instruction words
+    """
+    labels = {}
+    parsed = []
+    for line in source.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.endswith(":"):
+            labels[line[:-1].strip()] = len(parsed)
+            continue
+        name, _, operands = line.partition(" ")
+        args = [arg.strip() for arg in operands.split(",") if arg.strip()]
+        parsed.append((name.upper(), args))
+
+    words = []
+    for name, args in parsed:
+        if name not in MNEMONICS:
+            raise ValueError(f"Unknown instruction: {name}")
+        expected = OPERAND_COUNTS.get(name, 3)
+        if len(args) != expected:
+            raise ValueError(f"{name} takes {expected} operand(s), got {len(args)}")
+        if name in ("JMP", "JC"):
+            target = labels[args[0]] if args[0] in labels else int(args[0], 0)
+            words.append(encode(BR, target=target, conditional=name == "JC"))
+        elif name == "LDI":
+            words.append(encode(LDI, _register(args[0]), int(args[1], 0)))
+        elif name == "NOT":
+            words.append(encode(ALU.NOT, _register(args[0]), _register(args[1])))
+        else:
+            rd, ra, rb = (_register(arg) for arg in args)
+            words.append(encode(MNEMONICS[name], rd, ra, rb))
+    return struct.pack(f"<{len(words)}H", *words)
+
+
+def _register(name):
+    """Parse a register name (r0-r3)"""
+    name = name.lower()
+    if len(name) != 2 or name[0] != "r" or name[1] not in "0123":
+        raise ValueError(f"Invalid register: {name}")
+    return int(name[1])
+
+
+def decode(image):
+    """
+    Decode a binary program into a list of instruction tuples
+
+    ALU instructions become (op_code << 4, rd, ra, rb) so the dispatch loop
+    can form the lookup-table index directly.
+
+    Returns:
+        list: Decoded (kind, x, y, z) tuples
+    """
+    if len(image) % 2:
+        raise ValueError("Program image must contain whole 16-bit words")
+    program = [None] * (len(image) // 2)
+    for pc, (word,) in enumerate(struct.iter_unpack("<H", image)):
+        op_code = word & 0b111
+        if op_code == BR:
+            program[pc] = (BR, (word >> 3) & 1, word >> 4, 0)
+        elif op_code == LDI:
+            program[pc] = (LDI, (word >> 3) & 0b11, (word >> 5) & 0b11, 0)
+        else:
+            program[pc] = (op_code << 4, (word >> 3) & 0b11, (word >> 5) & 0b11, (word >> 7) & 0b11)
+    return program
+
+
+class CPU:
+    """Register file and instruction executor on top of the ALU"""
+
+    def __init__(self, image=b""):
+        self.table = LookupALU().table
+        self.registers = [0, 0, 0, 0]
+        self.carry = 0
+        self.pc = 0
+        self.load(image)
+
+    def load(self, image):
+        """Decode a program image and reset the program counter"""
+        self.program = decode(image)
+        self.pc = 0
+
+    def run(self, max_steps=None):
+        """
+        Execute instructions until the program runs off its end or
+        max_steps instructions have been executed
+
+        Returns:
+            int: Number of instructions executed
+        """
+        program = self.program
+        table = self.table
+        regs = self.registers
+        carry = self.carry
+        pc = self.pc
+        end = len(program)
+        limit = sys.maxsize if max_steps is None else max_steps
+        steps = 0
+        while pc < end and steps < limit:
+            kind, x, y, z = program[pc]
+            pc += 1
+            steps += 1
+            if kind == BR:
+                if not x or carry:
+                    pc = y
+            elif kind == LDI:
+                regs[x] = y
+            else:
+                entry = table[kind | (regs[y] << 2) | regs[z]]
+                regs[x] = entry[0]
+                carry = entry[1]
+        self.carry = carry
+        self.pc = pc
+        return steps
+
+
+def bench_cpu(steps=5_000_000):
+    """
+    Measure instructions per second on an endless counting loop
+
+    Returns:
+        float: Instructions per second
+    """
+    cpu = CPU(assemble("""
+        LDI r1, 1
+    loop:
+        ADD r0, r0, r1      # count
+        XOR r2, r2, r0
+        AND r3, r2, r1
+        JMP loop
+    """))
+    start = time.perf_counter()
+    executed = cpu.run(steps)
+    rate = executed / (time.perf_counter() - start)
+    print(f"{executed:,} instructions at {rate:,.0f} instructions/s")
+    return rate
+
+
+def main(argv=None):
+    """Run a binary program file, or the benchmark when none is given"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        bench_cpu()
+        return 0
+    with open(argv[0], "rb") as f:
+        cpu = CPU(f.read())
+    steps = cpu.run(int(argv[1]) if len(argv) > 1 else None)
+    print(f"Executed {steps} instructions")
+    for i, value in enumerate(cpu.registers):
+        print(f"r{i} = {value:02b}")
+    print(f"carry = {cpu.carry}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+ALU Stuck-At Fault Simulation
+This module grades test vectors against single stuck-at faults in the
+gate-level ALU netlist:
+- A stuck-at-0 and a stuck-at-1 fault on every primary input and gate output
+- Parallel-fault simulation: bit 0 of every value is the fault-free circuit
+  and bit j the circuit with fault j, so one pass of the compiled netlist
+  simulates every fault for one (op, a, b) vector
+- Outputs are compared with ALU.execute as the golden reference
+- Fault coverage, undetected faults and a small test set that detects every
+  detectable fault (greedy set cover with redundant vectors removed)
+"""
+
+import argparse
+import sys
+import time
+
+from alu_netlist import GND, VCC, alu_inputs, build_alu_netlist
+from alu_simulator import ALU, OP_NAMES, NBitALU, format_binary
+
+
+def fault_sites(net):
+    """Every net a fault can be injected on: primary inputs, then gate outputs"""
+    return list(net.inputs) + [gate.output for gate in net.gates]
+
+
+def fault_list(net):
+    """All single stuck-at faults as (net, stuck_value) pairs"""
+    return [(site, value) for site in fault_sites(net) for value in (0, 1)]
+
+
+def compile_fault_simulator(net, faults):
+    """
+    Compile the netlist into a parallel-fault evaluation function
+
+    Every value is a Python int with len(faults) + 1 bits. Bit 0 carries
+    the fault-free circuit and bit j + 1 the circuit with faults[j]; the
+    stuck-at masks are baked into the generated code as constants.
+
+    Returns:
+        function: evaluate(*inputs) -> tuple of outputs, where each input is
+        0 or 1 and each output holds one bit per simulated machine
+    """
+    mask = (1 << (len(faults) + 1)) - 1
+    stuck0 = {}
+    stuck1 = {}
+    for j, (site, value) in enumerate(faults, 1):
+        target = stuck1 if value else stuck0
+        target[site] = target.get(site, 0) | 1 << j
+
+    def inject(var, expr, site):
+        if site not in stuck0 and site not in stuck1:
+            return f"    {var} = {expr}"
+        keep = mask & ~stuck0.get(site, 0)
+        return f"    {var} = ({expr}) & {keep} | {stuck1.get(site, 0)}"
+
+    names = {VCC: str(mask), GND: "0"}
+    params = []
+    lines = []
+    for i, site in enumerate(net.inputs):
+        names[site] = f"i{i}"
+        params.append(f"i{i}")
+        # Broadcast the 0/1 input to every machine before injecting faults
+        lines.append(inject(f"i{i}", f"-i{i} & {mask}", site))
+    count = 0
+    for gates in net.levelize():
+        for gate in gates:
+            var = f"n{count}"
+            count += 1
+            ins = [names[n] for n in gate.inputs]
+            if gate.type == "AND":
+                expr = f"{ins[0]} & {ins[1]}"
+            elif gate.type == "OR":
+                expr = f"{ins[0]} | {ins[1]}"
+            elif gate.type == "XOR":
+                expr = f"{ins[0]} ^ {ins[1]}"
+            else:
+                expr = f"{ins[0]} ^ {mask}"
+            lines.append(inject(var, expr, gate.output))
+            names[gate.output] = var
+    outs = ", ".join(names[n] for n in net.outputs)
+    source = "\n".join([f"def evaluate({', '.join(params)}):"] + lines
+                       + [f"    return ({outs}{',' if len(net.outputs) == 1 else ''})"])
+    namespace = {}
+    exec(source, namespace)
+    return namespace["evaluate"]
+
+
+class FaultSimulator:
+    """Runs every (op, a, b) vector against every stuck-at fault in one pass each"""
+
+    def __init__(self, width=2, net=None, faults=None):
+        """
+        Args:
+            width (int): Operand width in bits
+            net (Netlist): Netlist to grade (the width's ALU by default)
+            faults (list): Subset of fault_list(net) to simulate (all by default)
+        """
+        self.width = width
+        self.net = net or build_alu_netlist(width)
+        self.faults = fault_list(self.net) if faults is None else list(faults)
+        self.evaluate = compile_fault_simulator(self.net, self.faults)
+        self.reference = ALU() if width == 2 else NBitALU(width)
+        self.all_faults = (1 << (len(self.faults) + 1)) - 2
+
+    def vectors(self):
+        """Every (op_code, a, b) vector of the exhaustive space"""
+        size = 1 << self.width
+        return [(op_code, a, b) for op_code in sorted(self.reference.operations)
+                for a in range(size) for b in range(size)]
+
+    def detect(self, op_code, a, b):
+        """
+        Simulate one vector against every fault
+
+        Returns:
+            int: Bit j + 1 set when faults[j] changes an output
+
+        Raises:
+            AssertionError: If the fault-free netlist disagrees with the
+            reference ALU
+        """
+        width = self.width
+        outputs = self.evaluate(*alu_inputs(width, op_code, a, b))
+        result, carry = self.reference.execute(op_code, a, b)
+        expected = [result >> i & 1 for i in range(width)] + [carry]
+        full = self.all_faults | 1
+        detected = 0
+        for value, bit in zip(outputs, expected):
+            detected |= value ^ (full if bit else 0)
+        if detected & 1:
+            raise AssertionError(f"Fault-free netlist disagrees with the ALU for "
+                                 f"{OP_NAMES[op_code]} {a} {b}")
+        return detected
+
+    def run(self, vectors=None):
+        """
+        Grade a list of vectors (every vector by default)
+
+        Returns:
+            dict: vectors, per-vector detection masks, the union of detected
+            faults, coverage and elapsed time
+        """
+        vectors = self.vectors() if vectors is None else list(vectors)
+        start = time.perf_counter()
+        detected = [self.detect(*vector) for vector in vectors]
+        union = 0
+        for mask in detected:
+            union |= mask
+        elapsed = time.perf_counter() - start
+        return {
+            "vectors": vectors,
+            "detected": detected,
+            "union": union,
+            "coverage": bin(union).count("1") / len(self.faults),
+            "elapsed": elapsed,
+        }
+
+    def undetected(self, union):
+        """Faults no vector detects (redundant logic or untestable nets)"""
+        return [fault for j, fault in enumerate(self.faults, 1) if not union >> j & 1]
+
+
+def minimal_test_set(vectors, detected):
+    """
+    Choose a small subset of vectors that detects every detectable fault
+
+    Greedy set cover (always take the vector detecting the most remaining
+    faults), followed by a pass that drops any chosen vector whose faults
+    are all detected by the others.
+
+    Returns:
+        list: (vector, detection mask) pairs
+    """
+    remaining = 0
+    for mask in detected:
+        remaining |= mask
+    candidates = list(zip(vectors, detected))
+    chosen = []
+    while remaining:
+        vector, mask = max(candidates, key=lambda item: bin(item[1] & remaining).count("1"))
+        chosen.append((vector, mask))
+        remaining &= ~mask
+
+    for i in range(len(chosen) - 1, -1, -1):
+        others = 0
+        for j, (_, mask) in enumerate(chosen):
+            if j != i:
+                others |= mask
+        if chosen[i][1] & ~others == 0:
+            del chosen[i]
+    return chosen
+
+
+def format_vector(width, vector):
+    """Format a vector as an "OP A B" text trace line"""
+    op_code, a, b = vector
+    return f"{OP_NAMES[op_code]} 0b{format_binary(a, width)} 0b{format_binary(b, width)}"
+
+
+def main(argv=None):
+    """Command-line entry point for fault grading"""
+    parser = argparse.ArgumentParser(description="Stuck-at fault coverage of the gate-level ALU")
+    parser.add_argument("--width", type=int, default=2, help="operand width in bits (default: 2)")
+    parser.add_argument("--output", "-o", help="write the test set as an 'OP A B' trace file")
+    parser.add_argument("--list", action="store_true", help="list the undetected faults")
+    args = parser.parse_args(argv)
+    if not 1 <= args.width <= 6:
+        parser.error("--width must be between 1 and 6 for exhaustive fault grading")
+
+    sim = FaultSimulator(args.width)
+    report = sim.run()
+    vectors = report["vectors"]
+    undetected = sim.undetected(report["union"])
+    print(f"{args.width}-bit ALU: {len(sim.net.gates)} gates, {len(fault_sites(sim.net))} nets, "
+          f"{len(sim.faults)} stuck-at faults")
+    print(f"Simulated {len(vectors)} vectors x {len(sim.faults)} faults "
+          f"in {report['elapsed'] * 1000:.1f} ms")
+    print(f"Fault coverage: {report['coverage']:.1%} "
+          f"({len(sim.faults) - len(undetected)}/{len(sim.faults)} detected)")
+    if args.list and undetected:
+        print("\nUndetected faults:")
+        for site, value in undetected:
+            print(f"  {site} stuck-at-{value}")
+
+    tests = minimal_test_set(vectors, report["detected"])
+    print(f"\nTest set: {len(tests)} vectors detect every detectable fault")
+    for vector, mask in tests:
+        print(f"  {format_vector(args.width, vector):<16} detects {bin(mask).count('1'):>4} faults")
+    if args.output:
+        with open(args.output, "w") as f:
+            f.writelines(format_vector(args.width, vector) + "\n" for vector, _ in tests)
+        print(f"Wrote test set to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+ALU Instrumentation
+This module records what an ALU is doing under load:
+- Per-opcode call counts and carry/borrow frequency
+- Latency histograms for execute and execute_batch calls
+- Consumer callbacks and JSON / Prometheus text exporters
+
+Instrumentation wraps an ALU in a proxy instead of modifying it, so the
+original (or unwrapped) ALU keeps running the unmodified class methods and
+pays nothing when instrumentation is disabled.
+"""
+
+import json
+import time
+from bisect import bisect_left
+
+from alu_simulator import ALU, OP_NAMES
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.reset()
+
+    def reset(self):
+        """Clear all observations"""
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """Record one observation"""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def to_dict(self):
+        """Return the histogram as plain data"""
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        return {"buckets": dict(zip(bounds, self.counts)), "sum": self.total, "count": self.count}
+
+
+class Instrumentation:
+    """Counters, histograms and callbacks for one or more ALU instances"""
+
+    def __init__(self):
+        self.calls = {}
+        self.carries = {}
+        self.latency = {"execute": Histogram(), "execute_batch": Histogram()}
+        self.batches = 0
+        self.callbacks = {"execute": [], "execute_batch": []}
+
+    def register(self, event, callback):
+        """
+        Register a callback for "execute" or "execute_batch"
+
+        Callbacks receive (op_code(s), a, b, result, carry, elapsed_seconds).
+        """
+        if event not in self.callbacks:
+            raise ValueError(f"Unknown event: {event}")
+        self.callbacks[event].append(callback)
+
+    def wrap(self, alu):
+        """
+        Return an instrumented proxy for an ALU
+
+        The proxy exposes execute/execute_batch with recording and delegates
+        every other attribute to the ALU; call unwrap() to get the ALU back.
+        """
+        return InstrumentedALU(alu, self)
+
+    def _record_batch(self, ops, carry, elapsed):
+        """Fold one batch into the per-opcode counters"""
+        import numpy as np
+
+        # Same conversion as execute_batch, so bytes-like batches work too;
+        # bincount needs a signed index type (uint64 codes do not cast)
+        ops = ALU._batch_array(ops).ravel().astype(np.intp, copy=False)
+        per_op = np.bincount(ops, minlength=8)
+        with_carry = np.bincount(ops[ALU._batch_array(carry).ravel() != 0], minlength=8)
+        for op_code in np.flatnonzero(per_op):
+            op_code = int(op_code)
+            self.calls[op_code] = self.calls.get(op_code, 0) + int(per_op[op_code])
+            if with_carry[op_code]:
+                self.carries[op_code] = self.carries.get(op_code, 0) + int(with_carry[op_code])
+        self.batches += 1
+        self.latency["execute_batch"].observe(elapsed)
+
+    def reset(self):
+        """Clear all counters and histograms"""
+        self.calls.clear()
+        self.carries.clear()
+        for histogram in self.latency.values():
+            histogram.reset()
+        self.batches = 0
+
+    def snapshot(self):
+        """Return all counters as plain data"""
+        return {
+            "operations": {
+                OP_NAMES.get(op, str(op)): {"calls": n, "carries": self.carries.get(op, 0)}
+                for op, n in sorted(self.calls.items())
+            },
+            "batches": self.batches,
+            "latency_seconds": {name: h.to_dict() for name, h in self.latency.items()},
+        }
+
+    def to_json(self, indent=2):
+        """Export the counters as JSON"""
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix="alu"):
+        """Export the counters in the Prometheus text exposition format"""
+        lines = [
+            f"# HELP {prefix}_operations_total ALU operations executed.",
+            f"# TYPE {prefix}_operations_total counter",
+        ]
+        for op, n in sorted(self.calls.items()):
+            lines.append(f'{prefix}_operations_total{{op="{OP_NAMES.get(op, op)}"}} {n}')
+        lines += [
+            f"# HELP {prefix}_carries_total Operations that set the carry/borrow flag.",
+            f"# TYPE {prefix}_carries_total counter",
+        ]
+        for op, n in sorted(self.carries.items()):
+            lines.append(f'{prefix}_carries_total{{op="{OP_NAMES.get(op, op)}"}} {n}')
+        lines += [
+            f"# HELP {prefix}_batches_total Batches executed.",
+            f"# TYPE {prefix}_batches_total counter",
+            f"{prefix}_batches_total {self.batches}",
+            f"# HELP {prefix}_latency_seconds Call latency.",
+            f"# TYPE {prefix}_latency_seconds histogram",
+        ]
+        for name, histogram in self.latency.items():
+            cumulative = 0
+            bounds = [repr(b) for b in histogram.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                lines.append(f'{prefix}_latency_seconds_bucket{{call="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_latency_seconds_sum{{call="{name}"}} {histogram.total}')
+            lines.append(f'{prefix}_latency_seconds_count{{call="{name}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedALU:
+    """Proxy that records every execute/execute_batch call of an ALU"""
+
+    def __init__(self, alu, instrumentation):
+        self.alu = alu
+        self.instrumentation = instrumentation
+        self.execute = self._make_execute(alu.execute, instrumentation)
+
+    def __getattr__(self, name):
+        return getattr(self.alu, name)
+
+    def unwrap(self):
+        """Return the uninstrumented ALU"""
+        return self.alu
+
+    @staticmethod
+    def _make_execute(execute, instrumentation):
+        """Build the recording execute closure with its state bound locally"""
+        calls = instrumentation.calls
+        carries = instrumentation.carries
+        histogram = instrumentation.latency["execute"]
+        callbacks = instrumentation.callbacks["execute"]
+        clock = time.perf_counter
+
+        def instrumented_execute(op_code, a, b):
+            start = clock()
+            result, carry = execute(op_code, a, b)
+            elapsed = clock() - start
+            calls[op_code] = calls.get(op_code, 0) + 1
+            if carry:
+                carries[op_code] = carries.get(op_code, 0) + 1
+            histogram.observe(elapsed)
+            for callback in callbacks:
+                callback(op_code, a, b, result, carry, elapsed)
+            return result, carry
+
+        return instrumented_execute
+
+    def execute_batch(self, ops, a, b, out=None):
+        """Execute a batch through the ALU and record it"""
+        start = time.perf_counter()
+        result, carry = self.alu.execute_batch(ops, a, b, out=out)
+        elapsed = time.perf_counter() - start
+        self.instrumentation._record_batch(ops, carry, elapsed)
+        for callback in self.instrumentation.callbacks["execute_batch"]:
+            callback(ops, a, b, result, carry, elapsed)
+        return result, carry
@@ -0,0 +1,399 @@
+"""
+Headless Circuit Rendering
+This module renders the visualizer's circuit diagrams without a display:
+- SVGCanvas implements the subset of the Tk canvas API used by CircuitView
+- Every (operation, A, B) frame is written as SVG and, optionally, as PNG
+  through a small pure-Python rasterizer (built-in 5x7 font, no
+  antialiasing) and PNG encoder
+- Frames are rendered in parallel worker processes; each worker keeps one
+  retained-mode view, so every circuit layout is built once per process
+- Rendered frames are kept in the artifact cache (alu_cache.py), so a
+  warm regenerate only copies them out
+"""
+
+import argparse
+import math
+import os
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+from alu_simulator import OPERATIONS, LookupALU
+from alu_cache import artifact_key, default_cache
+from alu_circuit import CircuitView
+
+WIDTH = 900
+HEIGHT = 360
+
+
+class SVGCanvas:
+    """In-memory canvas with the Tk item API, serialized as SVG"""
+
+    def __init__(self, width=WIDTH, height=HEIGHT):
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.tags = {}
+        self._next_id = 1
+
+    def _create(self, kind, coords, options):
+        item = self._next_id
+        self._next_id += 1
+        tags = options.pop("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        for tag in tags:
+            self.tags.setdefault(tag, []).append(item)
+        self.items[item] = [kind, coords, options]
+        return item
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_arc(self, *coords, **options):
+        return self._create("arc", coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create("polygon", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def itemconfigure(self, tag_or_id, **options):
+        """Update the options of one item, or of every item with a tag"""
+        targets = self.tags.get(tag_or_id, []) if isinstance(tag_or_id, str) else [tag_or_id]
+        for item in targets:
+            self.items[item][2].update(options)
+
+    itemconfig = itemconfigure
+
+    def to_svg(self):
+        """Serialize every visible item as an SVG document"""
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" '
+            f'height="{self.height}" viewBox="0 0 {self.width} {self.height}">',
+            f'<rect width="{self.width}" height="{self.height}" fill="white"/>',
+        ]
+        for kind, coords, options in self.items.values():
+            if options.get("state") == "hidden":
+                continue
+            parts.append(_svg_item(kind, coords, options))
+        parts.append("</svg>\n")
+        return "\n".join(parts)
+
+    def to_png(self):
+        """Rasterize every visible item and encode the image as PNG"""
+        raster = Raster(self.width, self.height)
+        for kind, coords, options in self.items.values():
+            if options.get("state") != "hidden":
+                raster.draw_item(kind, coords, options)
+        return raster.to_png()
+
+
+def _paint(options, fill, outline):
+    """SVG fill/stroke attributes using Tk's per-item-type defaults"""
+    fill = options.get("fill", fill) or "none"
+    stroke = options.get("outline", outline) or "none"
+    return f'fill="{fill}" stroke="{stroke}"'
+
+
+def _svg_item(kind, coords, options):
+    """Translate one canvas item into an SVG element"""
+    if kind == "line":
+        points = " ".join(f"{x:g},{y:g}" for x, y in zip(coords[::2], coords[1::2]))
+        color = options.get("fill", "black")
+        return f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="{options.get("width", 1)}"/>'
+    if kind == "rectangle":
+        x0, y0, x1, y1 = coords
+        return f'<rect x="{x0:g}" y="{y0:g}" width="{x1 - x0:g}" height="{y1 - y0:g}" {_paint(options, "", "black")}/>'
+    if kind == "oval":
+        x0, y0, x1, y1 = coords
+        return (f'<ellipse cx="{(x0 + x1) / 2:g}" cy="{(y0 + y1) / 2:g}" rx="{(x1 - x0) / 2:g}" '
+                f'ry="{(y1 - y0) / 2:g}" {_paint(options, "", "black")}/>')
+    if kind == "polygon":
+        points = " ".join(f"{x:g},{y:g}" for x, y in zip(coords[::2], coords[1::2]))
+        return f'<polygon points="{points}" {_paint(options, "black", "")}/>'
+    if kind == "arc":
+        return _svg_arc(coords, options)
+    if kind == "text":
+        x, y = coords
+        family, size = options.get("font", ("Arial", 9))[:2]
+        return (f'<text x="{x:g}" y="{y:g}" text-anchor="middle" dominant-baseline="central" '
+                f'font-family="{family}" font-size="{size}pt" fill="{options.get("fill", "black")}">'
+                f'{escape(str(options.get("text", "")))}</text>')
+    raise ValueError(f"Unsupported item type: {kind}")
+
+
+def _svg_arc(coords, options):
+    """Translate a Tk arc (bounding box, start and extent in degrees) into a path"""
+    x0, y0, x1, y1 = coords
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    rx, ry = (x1 - x0) / 2, (y1 - y0) / 2
+    start = math.radians(options.get("start", 0))
+    extent = options.get("extent", 90)
+    end = start + math.radians(extent)
+    # Tk angles run counterclockwise from 3 o'clock with y pointing up
+    sx, sy = cx + rx * math.cos(start), cy - ry * math.sin(start)
+    ex, ey = cx + rx * math.cos(end), cy - ry * math.sin(end)
+    large = 1 if abs(extent) > 180 else 0
+    sweep = 0 if extent > 0 else 1
+    path = f"M {sx:.2f} {sy:.2f} A {rx:g} {ry:g} 0 {large} {sweep} {ex:.2f} {ey:.2f}"
+    style = options.get("style", "pieslice")
+    if style == "chord":
+        path += " Z"
+        paint = _paint(options, "", "black")
+    elif style == "pieslice":
+        path += f" L {cx:.2f} {cy:.2f} Z"
+        paint = _paint(options, "", "black")
+    else:
+        paint = f'fill="none" stroke="{options.get("outline", "black")}"'
+    return f'<path d="{path}" {paint}/>'
+
+
+# Classic 5x7 font for ASCII 32-126: five column bytes per glyph, bit 0 at
+# the top and bit 7 for descenders
+FONT = bytes.fromhex(
+    "0000000000" "00005f0000" "0007000700" "147f147f14" "242a7f2a12" "2313086462"
+    "3649562050" "0008070300" "001c224100" "0041221c00" "2a1c7f1c2a" "08083e0808"
+    "0080703000" "0808080808" "0000606000" "2010080402" "3e5149453e" "00427f4000"
+    "7249494946" "2141494d33" "1814127f10" "2745454539" "3c4a494931" "4121110907"
+    "3649494936" "464949291e" "0000140000" "0040340000" "0008142241" "1414141414"
+    "0041221408" "0201590906" "3e415d594e" "7c1211127c" "7f49494936" "3e41414122"
+    "7f4141413e" "7f49494941" "7f09090901" "3e41415173" "7f0808087f" "00417f4100"
+    "2040413f01" "7f08142241" "7f40404040" "7f021c027f" "7f0408107f" "3e4141413e"
+    "7f09090906" "3e4151215e" "7f09192946" "2649494932" "01017f0101" "3f4040403f"
+    "1f2040201f" "3f4038403f" "6314081463" "0304780403" "6159494d43" "007f414141"
+    "0204081020" "004141417f" "0402010204" "4040404040" "0003070800" "2054547840"
+    "7f28444438" "3844444428" "384444287f" "3854545418" "00087e0902" "18a4a49c78"
+    "7f08040478" "00447d4000" "2040403d00" "7f10284400" "00417f4000" "7c04780478"
+    "7c08040478" "3844444438" "fc18242418" "18242418fc" "7c08040408" "4854545424"
+    "04043f4424" "3c4040207c" "1c2040201c" "3c4030403c" "4428102844" "4c9090907c"
+    "4464544c44" "0008364100" "0000770000" "0041360800" "0201020402"
+)
+
+# Tk color names used by the circuit views (Tk uses the X11 values)
+COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "gray": (190, 190, 190),
+    "grey": (190, 190, 190),
+}
+
+
+def _rgb(color):
+    """RGB bytes of a Tk color name or #rrggbb string"""
+    if color.startswith("#") and len(color) == 7:
+        return bytes.fromhex(color[1:])
+    if color.lower() not in COLORS:
+        raise ValueError(f"Unsupported color: {color}")
+    return bytes(COLORS[color.lower()])
+
+
+class Raster:
+    """RGB pixel buffer that draws canvas items with the Tk item defaults"""
+
+    def __init__(self, width=WIDTH, height=HEIGHT):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(b"\xff" * (width * height * 3))
+
+    def span(self, y, x0, x1, color):
+        """Fill pixels x0 <= x < x1 of row y"""
+        x0, x1 = max(x0, 0), min(x1, self.width)
+        if 0 <= y < self.height and x0 < x1:
+            start = (y * self.width + x0) * 3
+            self.pixels[start:start + (x1 - x0) * 3] = color * (x1 - x0)
+
+    def fill_polygon(self, points, color):
+        """Scanline fill (even-odd rule, sampled at pixel centers)"""
+        edges = list(zip(points, points[1:] + points[:1]))
+        top = max(0, math.floor(min(y for _, y in points)))
+        bottom = min(self.height, math.ceil(max(y for _, y in points)))
+        for y in range(top, bottom):
+            center = y + 0.5
+            crossings = sorted(
+                x0 + (center - y0) * (x1 - x0) / (y1 - y0)
+                for (x0, y0), (x1, y1) in edges
+                if (y0 <= center) != (y1 <= center)
+            )
+            for left, right in zip(crossings[::2], crossings[1::2]):
+                self.span(y, math.ceil(left - 0.5), math.ceil(right - 0.5), color)
+
+    def line(self, points, color, width=1):
+        """Polyline of the given width, stamped with a square pen"""
+        pen = max(1, round(width))
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            steps = max(1, round(max(abs(x1 - x0), abs(y1 - y0))))
+            for i in range(steps + 1):
+                x = math.floor(x0 + (x1 - x0) * i / steps - (pen - 1) / 2)
+                y = math.floor(y0 + (y1 - y0) * i / steps - (pen - 1) / 2)
+                for row in range(y, y + pen):
+                    self.span(row, x, x + pen, color)
+
+    def text(self, x, y, text, color, size=9):
+        """Text centered on (x, y), scaled from the 5x7 font by point size"""
+        scale = max(1, int(size * 4 / 3 / 8))
+        left = round(x - (len(text) * 6 - 1) * scale / 2)
+        top = round(y - 7 * scale / 2)
+        for i, char in enumerate(text):
+            code = ord(char) - 32
+            if not 0 <= code < len(FONT) // 5:
+                code = ord("?") - 32
+            for column, bits in enumerate(FONT[code * 5:code * 5 + 5]):
+                gx = left + (i * 6 + column) * scale
+                for row in range(8):
+                    if bits >> row & 1:
+                        for dy in range(scale):
+                            self.span(top + row * scale + dy, gx, gx + scale, color)
+
+    def shape(self, points, options, fill, outline, closed=True):
+        """Fill and outline a shape with Tk's defaults for its item type"""
+        fill = options.get("fill", fill)
+        outline = options.get("outline", outline)
+        if fill and closed:
+            self.fill_polygon(points, _rgb(fill))
+        if outline:
+            self.line(points + points[:1] if closed else points, _rgb(outline), options.get("width", 1))
+
+    def draw_item(self, kind, coords, options):
+        """Draw one canvas item"""
+        pairs = list(zip(coords[::2], coords[1::2]))
+        if kind == "line":
+            if options.get("fill", "black"):
+                self.line(pairs, _rgb(options.get("fill", "black")), options.get("width", 1))
+        elif kind == "rectangle":
+            (x0, y0), (x1, y1) = pairs
+            self.shape([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], options, "", "black")
+        elif kind == "oval":
+            self.shape(_ellipse(*coords, 0, 360), options, "", "black")
+        elif kind == "polygon":
+            self.shape(pairs, options, "black", "")
+        elif kind == "arc":
+            start, extent = options.get("start", 0), options.get("extent", 90)
+            points = _ellipse(*coords, start, extent)
+            style = options.get("style", "pieslice")
+            if style == "pieslice":
+                points.append(((coords[0] + coords[2]) / 2, (coords[1] + coords[3]) / 2))
+            self.shape(points, options, "", "black", closed=style != "arc")
+        elif kind == "text":
+            size = options.get("font", ("Arial", 9))[1]
+            self.text(coords[0], coords[1], str(options.get("text", "")),
+                      _rgb(options.get("fill", "black")), size)
+        else:
+            raise ValueError(f"Unsupported item type: {kind}")
+
+    def to_png(self):
+        """Encode the buffer as an 8-bit RGB PNG"""
+        stride = self.width * 3
+        raw = b"".join(b"\x00" + self.pixels[y * stride:(y + 1) * stride] for y in range(self.height))
+
+        def chunk(tag, data):
+            return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+        return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+                + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b""))
+
+
+def _ellipse(x0, y0, x1, y1, start, extent, segments=64):
+    """Points along a Tk arc: degrees counterclockwise from 3 o'clock, y up"""
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    rx, ry = (x1 - x0) / 2, (y1 - y0) / 2
+    count = max(2, math.ceil(segments * abs(extent) / 360))
+    points = []
+    for i in range(count + 1):
+        angle = math.radians(start + extent * i / count)
+        points.append((cx + rx * math.cos(angle), cy - ry * math.sin(angle)))
+    return points
+
+
+# One retained-mode view per worker process
+_view = None
+
+
+def render_frame(op_name, a, b, fmt="svg"):
+    """
+    Render one frame, or load it from the artifact cache
+
+    Returns:
+        memoryview: The SVG (UTF-8) or PNG file contents
+    """
+    key = artifact_key(f"frame-{op_name.lower()}-{a:02b}{b:02b}-{fmt}", 2,
+                       [code for _, code in OPERATIONS])
+    return default_cache().fetch(key, lambda: _draw_frame(op_name, a, b, fmt))
+
+
+def _draw_frame(op_name, a, b, fmt):
+    """Draw one frame on this process's retained-mode view"""
+    global _view
+    if _view is None:
+        _view = CircuitView(SVGCanvas())
+    result, carry = LookupALU().execute(dict(OPERATIONS)[op_name], a, b)
+    _view.show(op_name, a, b, result, carry)
+    if fmt == "png":
+        return _view.canvas.to_png()
+    return _view.canvas.to_svg().encode()
+
+
+def render_operation(op_name, out_dir, formats=("svg",)):
+    """
+    Render all 16 input combinations of one operation
+
+    Returns:
+        list: Paths of the files written
+    """
+    written = []
+    for a in range(4):
+        for b in range(4):
+            base = os.path.join(out_dir, f"{op_name.lower()}_{a:02b}_{b:02b}")
+            for fmt in formats:
+                with open(f"{base}.{fmt}", "wb") as f:
+                    f.write(render_frame(op_name, a, b, fmt))
+                written.append(f"{base}.{fmt}")
+    return written
+
+
+def render_all(out_dir, formats=("svg",), workers=None):
+    """
+    Render every (operation, A, B) frame in parallel
+
+    Returns:
+        list: Paths of the files written
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_operation, name, out_dir, formats)
+                   for name, _ in OPERATIONS]
+        return [path for future in futures for path in future.result()]
+
+
+def main(argv=None):
+    """Command-line entry point for headless rendering"""
+    parser = argparse.ArgumentParser(description="Render ALU circuit diagrams without a display")
+    parser.add_argument("--out", default="diagrams", help="output directory (default: diagrams)")
+    parser.add_argument("--png", action="store_true", help="also write PNG files")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    formats = ["svg", "png"] if args.png else ["svg"]
+
+    start = time.perf_counter()
+    written = render_all(args.out, formats, args.workers)
+    print(f"Wrote {len(written)} files to {args.out} in {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
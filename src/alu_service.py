@@ -0,0 +1,436 @@
+"""
+ALU RPC Service
+This module serves the 2-bit ALU to many local clients over one socket:
+- asyncio server on TCP or a Unix socket with persistent, pipelined
+  connections: clients send requests without waiting and match responses
+  by request id
+- Compact binary frames carrying the one-byte trace records of alu_trace,
+  (op << 4) | (a << 2) | b in and (carry << 2) | result back
+- Requests from every connection that arrive in the same event-loop pass
+  are coalesced into one batch and translated in a single pass
+- A load generator reporting p50/p99 latency and throughput for 1 to 1000
+  concurrent connections
+"""
+
+import asyncio
+import os
+import random
+import struct
+import subprocess
+import sys
+import time
+
+from alu_trace import INVALID, RESULT_BYTES, encode_record
+
+PORT = 7400
+
+# Frame headers: request id, method or status, payload length
+REQUEST = struct.Struct("<IBI")
+RESPONSE = struct.Struct("<IBI")
+
+# Methods
+EXECUTE = 0  # payload is one operation record
+BATCH = 1    # payload is any number of operation records
+
+# Response status; an error payload is a UTF-8 message
+OK = 0
+ERROR = 1
+
+MAX_PAYLOAD = 1 << 24
+READ_SIZE = 1 << 16
+
+
+class ALUService:
+    """
+    Protocol handler shared by every connection
+
+    Parsed requests are queued instead of answered one by one. The first
+    request queued schedules a flush with call_soon, so the reads of every
+    other connection that are ready in the same loop iteration join the
+    batch before it runs; a batch also flushes once it holds max_batch
+    records.
+    """
+
+    def __init__(self, max_batch=1 << 16):
+        self.max_batch = max_batch
+        self.pending = []
+        self.pending_records = 0
+        self.flush_scheduled = False
+        self.stats = {"connections": 0, "requests": 0, "operations": 0, "batches": 0}
+
+    async def handle(self, reader, writer):
+        """Serve one client connection until it closes"""
+        self.stats["connections"] += 1
+        buffer = bytearray()
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                buffer += data
+                offset = 0
+                while len(buffer) - offset >= REQUEST.size:
+                    request_id, method, length = REQUEST.unpack_from(buffer, offset)
+                    if length > MAX_PAYLOAD:
+                        self.reply(writer, request_id, ERROR, b"Payload too large")
+                        return
+                    end = offset + REQUEST.size + length
+                    if len(buffer) < end:
+                        break
+                    self.submit(writer, request_id, method, bytes(buffer[offset + REQUEST.size:end]))
+                    offset = end
+                del buffer[:offset]
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def reply(self, writer, request_id, status, payload):
+        """Send one response frame"""
+        if not writer.is_closing():
+            writer.write(RESPONSE.pack(request_id, status, len(payload)) + payload)
+
+    def submit(self, writer, request_id, method, payload):
+        """Validate a request and queue it for the next batch"""
+        if method not in (EXECUTE, BATCH):
+            self.reply(writer, request_id, ERROR, f"Unknown method: {method}".encode())
+            return
+        if method == EXECUTE and len(payload) != 1:
+            self.reply(writer, request_id, ERROR, b"execute takes exactly one record")
+            return
+        self.pending.append((writer, request_id, payload))
+        self.pending_records += len(payload)
+        if self.pending_records >= self.max_batch:
+            self.flush()
+        elif not self.flush_scheduled:
+            self.flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self):
+        """Execute every queued request as one batch and write the responses"""
+        self.flush_scheduled = False
+        pending, self.pending = self.pending, []
+        self.pending_records = 0
+        if not pending:
+            return
+        results = b"".join(payload for _, _, payload in pending).translate(RESULT_BYTES)
+        self.stats["batches"] += 1
+        self.stats["requests"] += len(pending)
+        self.stats["operations"] += len(results)
+
+        # Group the frames per connection so each gets a single write
+        frames = {}
+        offset = 0
+        for writer, request_id, payload in pending:
+            out = results[offset:offset + len(payload)]
+            offset += len(payload)
+            bad = out.find(INVALID)
+            if bad == -1:
+                frame = RESPONSE.pack(request_id, OK, len(out)) + out
+            else:
+                message = f"Invalid record 0x{payload[bad]:02x} at offset {bad}".encode()
+                frame = RESPONSE.pack(request_id, ERROR, len(message)) + message
+            frames.setdefault(writer, []).append(frame)
+        for writer, chunks in frames.items():
+            if not writer.is_closing():
+                writer.write(b"".join(chunks))
+
+
+async def serve(host="127.0.0.1", port=PORT, path=None, ready=None):
+    """
+    Run the service until cancelled
+
+    Args:
+        host, port: TCP address to listen on
+        path (str): Unix socket path (used instead of TCP when given)
+        ready (function): Called with the server once it is listening
+    """
+    service = ALUService()
+    if path:
+        server = await asyncio.start_unix_server(service.handle, path, backlog=1024)
+    else:
+        server = await asyncio.start_server(service.handle, host, port, backlog=1024)
+    if ready:
+        ready(server)
+    async with server:
+        await server.serve_forever()
+
+
+def encode_operations(operations):
+    """Encode (op_code, a, b) tuples as request records, checking their ranges"""
+    records = bytearray()
+    for op_code, a, b in operations:
+        if (a | b) & ~0b11:
+            raise ValueError("Inputs must be 2-bit values (0-3)")
+        if op_code & ~0b111:
+            raise ValueError(f"Invalid operation code: {op_code}")
+        records.append(encode_record(op_code, a, b))
+    return bytes(records)
+
+
+class ALUClient:
+    """
+    Pipelined client on one persistent connection
+
+    Any number of calls may be in flight at once; a background task reads
+    response frames and resolves the matching futures.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.futures = {}
+        self.next_id = 0
+        self.task = asyncio.ensure_future(self._read_responses())
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=PORT, path=None):
+        """Open a connection to the service (TCP, or a Unix socket when path is given)"""
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def call(self, method, payload):
+        """
+        Send one request and wait for its response
+
+        Returns:
+            bytes: Result records
+
+        Raises:
+            ValueError: If the service rejects the request
+            ConnectionError: If the connection is (or becomes) closed
+        """
+        if self.task.done():
+            raise ConnectionError("Connection closed")
+        request_id = self.next_id
+        self.next_id = (self.next_id + 1) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self.futures[request_id] = future
+        self.writer.write(REQUEST.pack(request_id, method, len(payload)) + payload)
+        if self.writer.transport.get_write_buffer_size() > READ_SIZE:
+            await self.writer.drain()
+        return await future
+
+    async def execute(self, op_code, a, b):
+        """
+        Execute one operation remotely
+
+        Returns:
+            tuple: (result, carry/borrow)
+        """
+        record = (await self.call(EXECUTE, encode_operations([(op_code, a, b)])))[0]
+        return record & 0b11, record >> 2
+
+    async def execute_batch(self, operations):
+        """
+        Execute many operations in one request
+
+        Args:
+            operations: (op_code, a, b) tuples, or already-encoded records
+
+        Returns:
+            list: (result, carry/borrow) per operation
+        """
+        if not isinstance(operations, (bytes, bytearray)):
+            operations = encode_operations(operations)
+        return [(record & 0b11, record >> 2) for record in await self.call(BATCH, bytes(operations))]
+
+    async def close(self):
+        """Close the connection"""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self.task
+
+    async def _read_responses(self):
+        """Resolve pending calls as response frames arrive"""
+        buffer = bytearray()
+        error = ConnectionError("Connection closed")
+        try:
+            while True:
+                data = await self.reader.read(READ_SIZE)
+                if not data:
+                    break
+                buffer += data
+                offset = 0
+                while len(buffer) - offset >= RESPONSE.size:
+                    request_id, status, length = RESPONSE.unpack_from(buffer, offset)
+                    end = offset + RESPONSE.size + length
+                    if len(buffer) < end:
+                        break
+                    payload = bytes(buffer[offset + RESPONSE.size:end])
+                    offset = end
+                    future = self.futures.pop(request_id, None)
+                    if future is None or future.done():
+                        continue
+                    if status == OK:
+                        future.set_result(payload)
+                    else:
+                        future.set_exception(ValueError(payload.decode()))
+                del buffer[:offset]
+        except ConnectionError as e:
+            error = e
+        except Exception as e:
+            error = ConnectionError(f"Connection failed: {e}")
+        finally:
+            # Nothing more will arrive: fail every call still waiting
+            for future in self.futures.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.futures.clear()
+
+
+def _raise_file_limit(needed):
+    """Raise the open-file soft limit so many connections fit (Unix only)"""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < needed:
+        target = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+def percentile(ordered, fraction):
+    """Value at the given fraction of an already-sorted list"""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def load_test(connections, duration=2.0, pipeline=1, batch=1, seed=0, **address):
+    """
+    Drive the service from many connections at once
+
+    Every connection keeps `pipeline` requests in flight, each carrying
+    `batch` random operations, for `duration` seconds.
+
+    Returns:
+        dict: requests, operations, throughput and p50/p99 latency
+    """
+    rng = random.Random(seed)
+    valid = [index for index, value in enumerate(RESULT_BYTES) if value != INVALID]
+    payloads = [bytes(rng.choice(valid) for _ in range(batch)) for _ in range(256)]
+    method = EXECUTE if batch == 1 else BATCH
+    clients = await asyncio.gather(*(ALUClient.connect(**address) for _ in range(connections)))
+    latencies = []
+
+    async def worker(client, start_index, deadline):
+        index = start_index
+        while True:
+            begin = time.perf_counter()
+            if begin >= deadline:
+                return
+            await client.call(method, payloads[index & 0xFF])
+            latencies.append(time.perf_counter() - begin)
+            index += 1
+
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(worker(client, i * pipeline + j, deadline)
+                           for i, client in enumerate(clients) for j in range(pipeline)))
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*(client.close() for client in clients))
+
+    latencies.sort()
+    return {
+        "connections": connections,
+        "requests": len(latencies),
+        "operations": len(latencies) * batch,
+        "throughput": len(latencies) * batch / elapsed,
+        "p50": percentile(latencies, 0.50) if latencies else 0.0,
+        "p99": percentile(latencies, 0.99) if latencies else 0.0,
+    }
+
+
+def spawn_server(host="127.0.0.1", port=PORT, path=None, timeout=10.0):
+    """
+    Start the service in a child process and wait until it accepts connections
+
+    Returns:
+        subprocess.Popen: The server process
+    """
+    command = [sys.executable, os.path.abspath(__file__), "serve"]
+    command += ["--unix", path] if path else ["--host", host, "--port", str(port)]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+
+    async def wait_ready():
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                client = await ALUClient.connect(host, port, path)
+                await client.close()
+                return
+            except OSError:
+                if process.poll() is not None or time.perf_counter() > deadline:
+                    raise
+                await asyncio.sleep(0.05)
+
+    try:
+        asyncio.run(wait_ready())
+    except OSError:
+        process.kill()
+        raise
+    return process
+
+
+def main(argv=None):
+    """Command-line entry point: run the service or the load generator"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local RPC service for the 2-bit ALU")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, text in (("serve", "run the service"), ("load", "run the load generator")):
+        command = commands.add_parser(name, help=text)
+        command.add_argument("--host", default="127.0.0.1", help="TCP host (default: 127.0.0.1)")
+        command.add_argument("--port", type=int, default=PORT, help=f"TCP port (default: {PORT})")
+        command.add_argument("--unix", metavar="PATH", help="use a Unix socket instead of TCP")
+    load = commands.choices["load"]
+    load.add_argument("--connections", type=int, nargs="+", default=[1, 10, 100, 1000],
+                      help="concurrent connection counts to test (default: 1 10 100 1000)")
+    load.add_argument("--duration", type=float, default=2.0,
+                      help="seconds per connection count (default: 2)")
+    load.add_argument("--pipeline", type=int, default=1,
+                      help="requests in flight per connection (default: 1)")
+    load.add_argument("--batch", type=int, default=1,
+                      help="operations per request; 1 uses execute (default: 1)")
+    load.add_argument("--spawn", action="store_true",
+                      help="start a server process for the duration of the test")
+    args = parser.parse_args(argv)
+    address = {"path": args.unix} if args.unix else {"host": args.host, "port": args.port}
+
+    if args.command == "serve":
+        _raise_file_limit(4096)
+        where = args.unix or f"{args.host}:{args.port}"
+        try:
+            asyncio.run(serve(**address, ready=lambda _: print(f"Serving the ALU on {where}", flush=True)))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    _raise_file_limit(max(args.connections) + 256)
+    server = spawn_server(args.host, args.port, args.unix) if args.spawn else None
+    try:
+        print(f"Load test: {args.duration:g} s per step, pipeline {args.pipeline}, "
+              f"{args.batch} operation(s) per request")
+        print("Connections    Requests   Operations/s    p50 (us)    p99 (us)")
+        print("-" * 64)
+        for connections in args.connections:
+            stats = asyncio.run(load_test(connections, args.duration, args.pipeline,
+                                          args.batch, **address))
+            print(f"{connections:>11}  {stats['requests']:>10,}  {stats['throughput']:>13,.0f}  "
+                  f"{stats['p50'] * 1e6:>10,.0f}  {stats['p99'] * 1e6:>10,.0f}")
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -80,6 +80,335 @@ class ALU:
         
         # Execute the operation
         return self.operations[op_code](a, b)
+    
+    def _batch_tables(self, dtype):
+        """Build NumPy result/carry tables from the scalar operations"""
+        import numpy as np
+        
+        results = np.zeros(128, dtype=dtype)
+        carries = np.zeros(128, dtype=dtype)
+        for op_code, operation in self.operations.items():
+            for a in range(4):
+                for b in range(4):
+                    index = (op_code << 4) | (a << 2) | b
+                    results[index], carries[index] = operation(a, b)
+        return results, carries
+    
+    @staticmethod
+    def _batch_array(values):
+        """View an array-like or bytes-like batch input as a NumPy array"""
+        import numpy as np
+        
+        # np.asarray would turn bytes into a single string element
+        if isinstance(values, (bytes, bytearray)):
+            return np.frombuffer(values, dtype=np.uint8)
+        return np.asarray(values)
+    
+    def execute_batch(self, ops, a, b, out=None):
+        """
+        Execute many ALU operations in one vectorized pass
+        
+        Results come from tables generated by the scalar operations, so the
+        semantics are identical to execute().
+        
+        Args:
+            ops (array-like or buffer): 3-bit operation codes
+            a (array-like or buffer): 2-bit inputs A (0-3)
+            b (array-like or buffer): 2-bit inputs B (0-3)
+            out (tuple): Optional (result, carry) integer arrays to fill
+                instead of allocating new ones
+            
+        Returns:
+            tuple: (result array, carry/borrow array)
+        """
+        import numpy as np
+        
+        ops = self._batch_array(ops)
+        a = self._batch_array(a)
+        b = self._batch_array(b)
+        if not (ops.shape == a.shape == b.shape):
+            raise ValueError("ops, a and b must have the same shape")
+        
+        if out is None:
+            result = np.empty(a.shape, dtype=np.uint8)
+            carry = np.empty(a.shape, dtype=np.uint8)
+        else:
+            result, carry = out
+            if result.shape != a.shape or carry.shape != a.shape:
+                raise ValueError("Output arrays must match the input shape")
+        if not a.size:
+            return result, carry
+        
+        # Validate inputs in bulk (reductions avoid temporary arrays)
+        if a.min() < 0 or a.max() > 3 or b.min() < 0 or b.max() > 3:
+            raise ValueError("Inputs must be 2-bit values (0-3)")
+        last_op = max(self.operations)
+        if ops.min() < 0 or ops.max() > last_op:
+            bad = ops[(ops < 0) | (ops > last_op)]
+            raise ValueError(f"Invalid operation code: {int(bad[0])}")
+        
+        # Tables are cached per dtype so lookups never need to cast
+        tables = self.__dict__.setdefault("_tables", {})
+        for dtype in (result.dtype, carry.dtype):
+            if dtype not in tables:
+                tables[dtype] = self._batch_tables(dtype)
+        result_table = tables[result.dtype][0]
+        carry_table = tables[carry.dtype][1]
+        
+        # Build the table index (op << 4) | (a << 2) | b inside result
+        np.left_shift(ops, 2, out=result, casting="unsafe")
+        np.bitwise_or(result, a, out=result, casting="unsafe")
+        np.left_shift(result, 2, out=result, casting="unsafe")
+        np.bitwise_or(result, b, out=result, casting="unsafe")
+        
+        np.take(carry_table, result, out=carry)
+        np.take(result_table, result, out=result)
+        return result, carry
+
+
+class LookupALU(ALU):
+    """2-bit ALU that answers from a precomputed result table
+    
+    With 6 opcodes and 2-bit inputs there are only 96 possible results, so
+    every (result, carry) tuple is built once and indexed by
+    (op_code << 4) | (a << 2) | b. The table is shared by all instances.
+    """
+    
+    _table = None
+    
+    def __init__(self):
+        super().__init__()
+        if LookupALU._table is None:
+            LookupALU._table = self.build_table()
+        self.table = LookupALU._table
+    
+    def build_table(self):
+        """Build the flat lookup table (None for undefined opcodes)"""
+        table = [None] * 128
+        for op_code, operation in self.operations.items():
+            for a in range(4):
+                for b in range(4):
+                    table[(op_code << 4) | (a << 2) | b] = operation(a, b)
+        return tuple(table)
+    
+    def execute(self, op_code, a, b):
+        """
+        Execute the ALU operation using the lookup table
+        
+        Args:
+            op_code (int): 3-bit operation code
+            a (int): 2-bit input A (0-3)
+            b (int): 2-bit input B (0-3)
+            
+        Returns:
+            tuple: (result, carry/borrow)
+        """
+        # A single mask test covers negative and out-of-range values
+        if (a | b) & ~0b11:
+            raise ValueError("Inputs must be 2-bit values (0-3)")
+        if op_code & ~0b111:
+            raise ValueError(f"Invalid operation code: {op_code}")
+        
+        entry = self.table[(op_code << 4) | (a << 2) | b]
+        if entry is None:
+            raise ValueError(f"Invalid operation code: {op_code}")
+        return entry
+    
+    def lookup(self, index):
+        """Return the (result, carry) tuple for a prevalidated table index"""
+        return self.table[index]
+
+
+class NBitALU(ALU):
+    """An N-bit ALU with the same operation codes as the 2-bit ALU
+    
+    Arithmetic uses native Python integers masked to the configured width,
+    so every width runs in constant time per operation.
+    """
+    
+    def __init__(self, width=8):
+        """Initialize the ALU for the given bit width"""
+        if not 1 <= width <= 64:
+            raise ValueError(f"Unsupported width: {width} (1-64 bits)")
+        super().__init__()
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.sign_bit = 1 << (width - 1)
+    
+    def _add(self, a, b):
+        """Perform addition operation with carry"""
+        result = a + b
+        return result & self.mask, result >> self.width
+    
+    def _sub(self, a, b):
+        """Perform subtraction using 2's complement"""
+        return (a - b) & self.mask, 1 if a < b else 0
+    
+    def _not(self, a, _):
+        """Perform NOT operation (1's complement)"""
+        return (~a) & self.mask, 0
+    
+    def execute(self, op_code, a, b):
+        """
+        Execute the ALU operation
+        
+        Args:
+            op_code (int): 3-bit operation code
+            a (int): N-bit input A
+            b (int): N-bit input B
+            
+        Returns:
+            tuple: (result, carry/borrow)
+        """
+        if (a | b) & ~self.mask:
+            raise ValueError(f"Inputs must be {self.width}-bit values (0-{self.mask})")
+        
+        operation = self.operations.get(op_code)
+        if operation is None:
+            raise ValueError(f"Invalid operation code: {op_code}")
+        return operation(a, b)
+    
+    def execute_flags(self, op_code, a, b):
+        """
+        Execute the ALU operation and report all status flags
+        
+        Returns:
+            tuple: (result, carry/borrow, signed overflow)
+        """
+        result, carry = self.execute(op_code, a, b)
+        if op_code == self.ADD:
+            # Operands share a sign that differs from the result's
+            overflow = 1 if (a ^ result) & (b ^ result) & self.sign_bit else 0
+        elif op_code == self.SUB:
+            # Operands differ in sign and the result's sign differs from A
+            overflow = 1 if (a ^ b) & (a ^ result) & self.sign_bit else 0
+        else:
+            overflow = 0
+        return result, carry, overflow
+    
+    def _batch_operand(self, values):
+        """Convert a batch operand to uint64, rejecting non-integer, negative or oversized values"""
+        import numbers
+        import numpy as np
+        
+        error = ValueError(f"Inputs must be {self.width}-bit values (0-{self.mask})")
+        if isinstance(values, (bytes, bytearray, memoryview, np.ndarray)):
+            values = self._batch_array(values)
+            if values.dtype.kind not in "iu":
+                raise error
+            if values.dtype.kind == "i" and values.size and values.min() < 0:
+                raise error
+            return values.astype(np.uint64, copy=False)
+        
+        # Lists of Python ints may not fit any single NumPy integer type
+        # (inference would pick float64 and lose precision), so they are
+        # converted straight to uint64; floats would be truncated silently
+        if not all(isinstance(value, numbers.Integral)
+                   for value in np.asarray(values, dtype=object).flat):
+            raise error
+        try:
+            return np.asarray(values, dtype=np.uint64)
+        except OverflowError:
+            raise error from None
+    
+    def execute_batch(self, ops, a, b, out=None):
+        """
+        Execute many ALU operations in one vectorized pass
+        
+        Operands are processed as uint64 words; the carry out of the top
+        bit is recovered from the operand and sum bits so it is exact at
+        64 bits as well.
+        
+        Args:
+            ops (array-like or buffer): 3-bit operation codes
+            a (array-like or buffer): N-bit inputs A
+            b (array-like or buffer): N-bit inputs B
+            out (tuple): Optional (result, carry) arrays to fill
+            
+        Returns:
+            tuple: (result array, carry/borrow array)
+        """
+        import numpy as np
+        
+        ops = self._batch_array(ops)
+        a = self._batch_operand(a)
+        b = self._batch_operand(b)
+        if not (ops.shape == a.shape == b.shape):
+            raise ValueError("ops, a and b must have the same shape")
+        
+        if out is None:
+            result = np.empty(a.shape, dtype=np.uint64)
+            carry = np.empty(a.shape, dtype=np.uint8)
+        else:
+            result, carry = out
+            if result.shape != a.shape or carry.shape != a.shape:
+                raise ValueError("Output arrays must match the input shape")
+        if not a.size:
+            return result, carry
+        
+        mask = np.uint64(self.mask)
+        if a.max() > mask or b.max() > mask:
+            raise ValueError(f"Inputs must be {self.width}-bit values (0-{self.mask})")
+        last_op = max(self.operations)
+        if ops.min() < 0 or ops.max() > last_op:
+            bad = ops[(ops < 0) | (ops > last_op)]
+            raise ValueError(f"Invalid operation code: {int(bad[0])}")
+        
+        top = np.uint64(self.width - 1)
+        one = np.uint64(1)
+        for op_code in self.operations:
+            sel = ops == op_code
+            if not sel.any():
+                continue
+            x = a[sel]
+            y = b[sel]
+            c = 0
+            if op_code == self.AND:
+                r = x & y
+            elif op_code == self.OR:
+                r = x | y
+            elif op_code == self.XOR:
+                r = x ^ y
+            elif op_code == self.ADD:
+                r = (x + y) & mask
+                # Carry out of the MSB: both bits set, or either set and sum bit clear
+                c = (((x & y) | ((x | y) & ~r)) >> top) & one
+            elif op_code == self.SUB:
+                r = (x - y) & mask
+                c = x < y
+            else:
+                r = ~x & mask
+            result[sel] = r
+            carry[sel] = c
+        return result, carry
+
+
+def make_alu(width=2):
+    """Return the fastest ALU implementation for the given width"""
+    if width == 2:
+        return LookupALU()
+    return NBitALU(width)
+
+
+# Operation names in display order
+OPERATIONS = [
+    ("AND", ALU.AND),
+    ("OR", ALU.OR),
+    ("XOR", ALU.XOR),
+    ("ADD", ALU.ADD),
+    ("SUB", ALU.SUB),
+    ("NOT", ALU.NOT)
+]
+OP_NAMES = {code: name for name, code in OPERATIONS}
+OP_CODES = {name: code for name, code in OPERATIONS}
+
+
+def parse_op(text):
+    """Parse an operation name (e.g. ADD) or number (e.g. 3 or 0b011)"""
+    name = text.upper()
+    if name in OP_CODES:
+        return OP_CODES[name]
+    return int(text, 0)
 
 
 def format_binary(num, width=2):
@@ -87,41 +416,33 @@ def format_binary(num, width=2):
     return bin(num)[2:].zfill(width)
 
 
-def main():
-    """Main function to demonstrate the ALU functionality"""
-    alu = ALU()
-    
-    # Test all operations with different input combinations
-    test_operations = [
-        ("AND", ALU.AND),
-        ("OR", ALU.OR),
-        ("XOR", ALU.XOR),
-        ("ADD", ALU.ADD),
-        ("SUB", ALU.SUB),
-        ("NOT", ALU.NOT)
-    ]
-    
-    print("2-BIT ALU SIMULATOR")
-    print("===================")
+def truth_table(alu):
+    """Return the full truth table of every operation as one string"""
+    lines = ["2-BIT ALU SIMULATOR", "==================="]
     
     # Generate all possible 2-bit input combinations
     inputs = [(a, b) for a in range(4) for b in range(4)]
     
-    for op_name, op_code in test_operations:
-        print(f"\nOperation: {op_name} (Code: {format_binary(op_code, 3)})")
-        print("-" * 40)
-        print("  A  |  B  | Result | Carry/Borrow")
-        print("-" * 40)
+    for op_name, op_code in OPERATIONS:
+        lines.append(f"\nOperation: {op_name} (Code: {format_binary(op_code, 3)})")
+        lines.append("-" * 40)
+        lines.append("  A  |  B  | Result | Carry/Borrow")
+        lines.append("-" * 40)
         
         for a, b in inputs:
             result, carry = alu.execute(op_code, a, b)
-            print(f" {format_binary(a)} | {format_binary(b)} |   {format_binary(result)}   |     {carry}")
-    
+            lines.append(f" {format_binary(a)} | {format_binary(b)} |   {format_binary(result)}   |     {carry}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def interactive(alu):
+    """Prompt for operations and inputs until the user quits"""
     print("\nInteractive Mode:")
     while True:
         try:
             print("\nSelect operation:")
-            for i, (name, _) in enumerate(test_operations):
+            for i, (name, _) in enumerate(OPERATIONS):
                 print(f"{i}. {name}")
             
             print("q. Quit")
@@ -131,12 +452,12 @@ def main():
                 break
                 
             op_index = int(choice)
-            if 0 <= op_index < len(test_operations):
+            if 0 <= op_index < len(OPERATIONS):
                 a = int(input("Enter A (0-3): "))
                 b = int(input("Enter B (0-3): "))
                 
                 if 0 <= a <= 3 and 0 <= b <= 3:
-                    _, op_code = test_operations[op_index]
+                    _, op_code = OPERATIONS[op_index]
                     result, carry = alu.execute(op_code, a, b)
                     print(f"Result: {format_binary(result)} (Carry/Borrow: {carry})")
                 else:
@@ -145,10 +466,85 @@ def main():
                 print("Invalid choice")
         except ValueError as e:
             print(f"Error: {e}")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\nExiting...")
             break
 
 
+def main(argv=None):
+    """
+    Command-line entry point
+    
+    Subcommands: exec, table, bench, interactive and trace. With no
+    subcommand the truth table is printed followed by interactive mode.
+    """
+    import sys
+    
+    argv = sys.argv[1:] if argv is None else list(argv)
+    
+    # Fast path for scripted callers: plain "exec OP A [B]" and "table"
+    # skip argparse (and its regex/enum imports) entirely
+    if argv == ["table"]:
+        sys.stdout.write(truth_table(LookupALU()))
+        return
+    if argv[:1] == ["exec"] and len(argv) in (3, 4) and not any(x.startswith("-") for x in argv):
+        try:
+            op_code = parse_op(argv[1])
+            a = int(argv[2], 0)
+            b = int(argv[3], 0) if len(argv) == 4 else 0
+            result, carry = LookupALU().execute(op_code, a, b)
+        except ValueError as e:
+            raise SystemExit(f"Error: {e}")
+        sys.stdout.write(f"{format_binary(result)} {carry}\n")
+        return
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="2-bit ALU simulator")
+    commands = parser.add_subparsers(dest="command")
+    
+    exec_parser = commands.add_parser("exec", help="execute one operation")
+    exec_parser.add_argument("op", help="operation name or code (e.g. ADD or 3)")
+    exec_parser.add_argument("a", type=lambda x: int(x, 0), help="input A")
+    exec_parser.add_argument("b", type=lambda x: int(x, 0), nargs="?", default=0,
+                             help="input B (ignored by NOT)")
+    
+    commands.add_parser("table", help="print the truth table of every operation")
+    commands.add_parser("bench", help="run the throughput benchmarks")
+    commands.add_parser("interactive", help="prompt for operations")
+    
+    trace_parser = commands.add_parser("trace", help="replay a trace of operations")
+    trace_parser.add_argument("input", help="trace file to replay ('-' for stdin)")
+    trace_parser.add_argument("-o", "--output", default="-",
+                              help="write results to FILE (default: stdout)")
+    trace_parser.add_argument("--format", choices=["text", "binary"], default="text",
+                              help="trace record format (default: text)")
+    args = parser.parse_args(argv)
+    
+    if args.command == "exec":
+        try:
+            result, carry = LookupALU().execute(parse_op(args.op), args.a, args.b)
+        except ValueError as e:
+            raise SystemExit(f"Error: {e}")
+        sys.stdout.write(f"{format_binary(result)} {carry}\n")
+    elif args.command == "table":
+        sys.stdout.write(truth_table(LookupALU()))
+    elif args.command == "bench":
+        import alu_bench
+        alu_bench.main()
+    elif args.command == "interactive":
+        interactive(LookupALU())
+    elif args.command == "trace":
+        from alu_trace import replay
+        try:
+            replay(args.input, args.output, args.format)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"Error: {e}")
+    else:
+        alu = ALU()
+        sys.stdout.write(truth_table(alu))
+        interactive(alu)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,241 @@
+"""
+Multi-Process ALU Sweep Runner
+This module splits a verification sweep across worker processes:
+- The operand space (or a random vector budget) is cut into contiguous shards
+- Each worker runs the bit-parallel verifier over its shard
+- Workers return one compact statistics record per shard
+- Fault sweeps shard the stuck-at fault list instead: each worker grades
+  every vector against its slice of faults, and the per-vector detection
+  masks are merged into overall coverage
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from alu_fault import FaultSimulator, fault_list, minimal_test_set
+from alu_netlist import build_alu_netlist
+from alu_verify import PackedVerifier, describe_mismatch
+
+# Aggregated outcome of one shard (no per-vector objects cross the process boundary)
+ShardResult = namedtuple(
+    "ShardResult",
+    ["shard", "start", "stop", "vectors", "mismatches", "carries", "first", "elapsed"],
+)
+
+# Outcome of one fault shard: detected holds one mask per vector, with bit
+# j + 1 set when fault j of the full fault list changes an output
+FaultShardResult = namedtuple(
+    "FaultShardResult",
+    ["shard", "start", "stop", "vectors", "detected", "elapsed"],
+)
+
+# One verifier and one netlist per worker process, built on first use
+_verifiers = {}
+_nets = {}
+
+
+def _verifier(width):
+    """Return this process's verifier for the given width"""
+    if width not in _verifiers:
+        _verifiers[width] = PackedVerifier(width)
+    return _verifiers[width]
+
+
+def run_shard(width, shard, start, stop, random_seed=None):
+    """
+    Verify one shard
+
+    Args:
+        width (int): Operand width in bits
+        shard (int): Shard number
+        start, stop (int): Exhaustive index range, or vector count range
+            when random_seed is given
+        random_seed (int): Seed for a random shard (None for exhaustive)
+
+    Returns:
+        ShardResult: Aggregated statistics for the shard
+    """
+    verifier = _verifier(width)
+    if random_seed is None:
+        stats = verifier.run(start, stop)
+    else:
+        stats = verifier.run_random(stop - start, seed=(random_seed, shard))
+    return ShardResult(shard, start, stop, stats["vectors"], stats["mismatches"],
+                       stats["carries"], stats["first"], stats["elapsed"])
+
+
+def run_fault_shard(width, shard, start, stop):
+    """
+    Grade every vector against faults start..stop of fault_list()
+
+    Returns:
+        FaultShardResult: Detection masks shifted to full-list positions
+    """
+    if width not in _nets:
+        _nets[width] = build_alu_netlist(width)
+    net = _nets[width]
+    sim = FaultSimulator(width, net, fault_list(net)[start:stop])
+    report = sim.run()
+    return FaultShardResult(shard, start, stop, len(report["vectors"]),
+                            [mask << start for mask in report["detected"]], report["elapsed"])
+
+
+def make_shards(total, shards):
+    """Split [0, total) into `shards` contiguous, nearly equal ranges"""
+    shards = max(1, min(shards, total))
+    step, extra = divmod(total, shards)
+    bounds = []
+    start = 0
+    for i in range(shards):
+        stop = start + step + (1 if i < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def sweep(width=2, workers=None, shards=None, random_count=None, seed=0):
+    """
+    Run a sharded sweep across a process pool
+
+    Args:
+        width (int): Operand width in bits
+        workers (int): Worker processes (CPU count by default)
+        shards (int): Number of shards (4 per worker by default)
+        random_count (int): Check this many random vectors instead of the
+            exhaustive operand space
+        seed (int): Base random seed
+
+    Returns:
+        tuple: (list of ShardResult in shard order, wall time in seconds)
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shards or workers * 4
+    if random_count is None:
+        total = PackedVerifier.space_size(width)
+        random_seed = None
+    else:
+        total = random_count
+        random_seed = seed
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_shard, width, i, lo, hi, random_seed)
+                   for i, (lo, hi) in enumerate(make_shards(total, shards))]
+        results = [future.result() for future in futures]
+    return results, time.perf_counter() - start
+
+
+def sweep_faults(width=2, workers=None, shards=None):
+    """
+    Run a stuck-at fault sweep with the fault list sharded across a process pool
+
+    Every shard simulates every vector, so the default is one shard per
+    worker rather than the four used for operand sweeps.
+
+    Args:
+        width (int): Operand width in bits (exhaustive vectors, up to 6)
+        workers (int): Worker processes (CPU count by default)
+        shards (int): Number of fault-list slices (one per worker by default)
+
+    Returns:
+        tuple: (list of FaultShardResult in shard order, wall time in seconds)
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shards or workers
+    total = len(fault_list(build_alu_netlist(width)))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_fault_shard, width, i, lo, hi)
+                   for i, (lo, hi) in enumerate(make_shards(total, shards))]
+        results = [future.result() for future in futures]
+    return results, time.perf_counter() - start
+
+
+def report_faults(args):
+    """Run and print a sharded fault sweep"""
+    results, wall = sweep_faults(args.width, args.workers, args.shards)
+
+    if not args.quiet:
+        print("Shard  First fault  Last fault  Detected   Time (s)")
+        print("-" * 52)
+        for r in results:
+            union = 0
+            for mask in r.detected:
+                union |= mask
+            print(f"{r.shard:>5}  {r.start:>11}  {r.stop - 1:>10}  {bin(union).count('1'):>8}"
+                  f"  {r.elapsed:>9.3f}")
+
+    # Merge the shards: each vector detects the union of its shard masks
+    detected = [0] * results[0].vectors
+    for r in results:
+        for i, mask in enumerate(r.detected):
+            detected[i] |= mask
+    union = 0
+    for mask in detected:
+        union |= mask
+    faults = results[-1].stop
+    found = bin(union).count("1")
+    busy = sum(r.elapsed for r in results)
+    print(f"\n{len(detected):,} vectors x {faults:,} faults in {wall:.3f} s "
+          f"(worker time {busy:.3f} s)")
+    print(f"Fault coverage: {found / faults:.1%} ({found}/{faults} detected)")
+    tests = minimal_test_set(range(len(detected)), detected)
+    print(f"Test set: {len(tests)} vectors detect every detectable fault")
+    return 0
+
+
+def main(argv=None):
+    """Command-line entry point for sharded sweeps"""
+    parser = argparse.ArgumentParser(description="Multi-process ALU verification sweep")
+    parser.add_argument("--width", type=int, default=8, help="operand width in bits")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--shards", type=int, help="number of shards (default: 4 per worker, 1 per worker with --faults)")
+    parser.add_argument("--random", type=int, metavar="N",
+                        help="check N random vectors instead of the exhaustive space")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--faults", action="store_true",
+                        help="shard a stuck-at fault sweep (alu_fault.py) instead")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args(argv)
+
+    if args.faults:
+        if not 1 <= args.width <= 6:
+            parser.error("--width must be between 1 and 6 for exhaustive fault grading")
+        if args.random is not None:
+            parser.error("--random does not apply to fault sweeps")
+        return report_faults(args)
+    if args.random is None and args.width > 16:
+        parser.error("exhaustive sweeps are limited to 16 bits; use --random")
+
+    results, wall = sweep(args.width, args.workers, args.shards, args.random, args.seed)
+
+    if not args.quiet:
+        print("Shard       Start        Stop     Vectors  Mismatches   Time (s)")
+        print("-" * 66)
+        for r in results:
+            print(f"{r.shard:>5}  {r.start:>10}  {r.stop:>10}  {r.vectors:>10}"
+                  f"  {r.mismatches:>10}  {r.elapsed:>9.3f}")
+
+    vectors = sum(r.vectors for r in results)
+    mismatches = sum(r.mismatches for r in results)
+    carries = sum(r.carries for r in results)
+    busy = sum(r.elapsed for r in results)
+    print(f"\n{vectors:,} vectors in {wall:.3f} s ({vectors / wall:,.0f} vectors/s)")
+    print(f"Worker time {busy:.3f} s, parallel efficiency "
+          f"{busy / (wall * (args.workers or os.cpu_count() or 1)):.0%}")
+    print(f"Carry/borrow set on {carries:,} vectors")
+    first = next((r.first for r in results if r.first is not None), None)
+    if first is None:
+        print("No mismatches")
+        return 0
+    print(f"{mismatches:,} mismatches; first: {describe_mismatch(args.width, first)}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
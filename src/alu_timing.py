@@ -0,0 +1,297 @@
+"""
+ALU Timing Simulation
+This module adds propagation delays to the gate-level netlists:
+- Typical 74LS08/74LS32/74LS86/74LS04 rise and fall delays per gate
+- Event-driven simulation with a priority queue of timed net changes,
+  reporting settle time and glitches for every input transition
+- Static timing analysis: worst-case arrival times and the critical path
+- Ripple-carry versus carry-lookahead adder comparison
+"""
+
+import argparse
+import heapq
+import random
+import re
+import sys
+import time
+
+from alu_netlist import GATE_FUNCTIONS, GND, VCC, alu_inputs, build_adder, build_alu_netlist
+from alu_simulator import OP_NAMES, OPERATIONS
+
+# Typical (tPLH, tPHL) propagation delays in ns from the 74LS datasheets
+GATE_DELAYS = {
+    "AND": (8, 10),   # 74LS08
+    "OR": (14, 14),   # 74LS32
+    "XOR": (12, 10),  # 74LS86
+    "NOT": (9, 10),   # 74LS04
+}
+
+# Nets that carry or borrow information in the ALU and adder netlists
+CARRY_NET = re.compile(r"^(c\d+|COUT|CARRY|borrow|carry_add|carry_sub|and0|(add|sub)\d+_[cp])$")
+
+
+class TimingSimulator:
+    """
+    Event-driven simulation with per-gate rise/fall delays
+
+    Net changes are (time, sequence, net, value) events in a heap. When a
+    net changes, each gate it drives is re-evaluated and, if the gate's
+    projected output differs, an output event is scheduled after the gate's
+    rise or fall delay (transport delay, so short pulses are kept and show
+    up as glitches).
+    """
+
+    def __init__(self, net, delays=GATE_DELAYS):
+        self.net = net
+        self.order = [gate for gates in net.levelize() for gate in gates]
+        # Flattened gates for the inner loop: (output, type, in0, in1, rise, fall)
+        self.fanout = {}
+        for gate in net.gates:
+            rise, fall = delays[gate.type]
+            entry = (gate.output, gate.type, gate.inputs[0], gate.inputs[-1], rise, fall)
+            for name in gate.inputs:
+                self.fanout.setdefault(name, []).append(entry)
+        self.values = {VCC: 1, GND: 0}
+        self.events = 0
+        self.load({name: 0 for name in net.inputs})
+
+    def steady_state(self, inputs):
+        """Settled value of every net for the given primary input values"""
+        values = {VCC: 1, GND: 0}
+        values.update(inputs)
+        for gate in self.order:
+            values[gate.output] = GATE_FUNCTIONS[gate.type](*(values[n] for n in gate.inputs))
+        return values
+
+    def load(self, state):
+        """
+        Put the circuit in a settled state without simulating events
+
+        Args:
+            state (dict): Primary input values, or a full steady_state() dict
+        """
+        if len(state) == len(self.net.inputs):
+            state = self.steady_state(state)
+        self.values = dict(state)
+
+    def apply(self, changes):
+        """
+        Change primary inputs at t=0 and simulate until the circuit settles
+
+        Args:
+            changes (dict): New 0/1 value per primary input net
+
+        Returns:
+            tuple: (settle time in ns, {net: number of transitions})
+        """
+        values = self.values
+        fanout = self.fanout
+        projected = {}
+        pending = {}
+        cancelled = set()
+        transitions = {}
+        queue = []
+        seq = 0
+        settle = 0
+
+        def schedule(gate, now):
+            nonlocal seq
+            out, kind, in0, in1, rise, fall = gate
+            if kind == "AND":
+                value = values[in0] & values[in1]
+            elif kind == "OR":
+                value = values[in0] | values[in1]
+            elif kind == "XOR":
+                value = values[in0] ^ values[in1]
+            else:
+                value = values[in0] ^ 1
+            if value == projected.get(out, values[out]):
+                return
+            projected[out] = value
+            at = now + (rise if value else fall)
+            if out in pending and at <= pending[out][0]:
+                # A later input change overtakes the pending output change
+                # (unequal rise/fall delays): the pending change never happens
+                cancelled.add(pending.pop(out)[1])
+                if value == values[out]:
+                    return
+            seq += 1
+            pending[out] = (at, seq)
+            heapq.heappush(queue, (at, seq, out, value))
+
+        # Apply all input changes before evaluating, so simultaneous changes
+        # do not produce zero-width pulses
+        changed = [name for name, value in changes.items() if values[name] != value]
+        for name in changed:
+            values[name] = changes[name]
+            transitions[name] = 1
+        for gate in {gate for name in changed for gate in fanout.get(name, ())}:
+            schedule(gate, 0)
+
+        while queue:
+            now, number, name, value = heapq.heappop(queue)
+            if number in cancelled:
+                continue
+            self.events += 1
+            if pending.get(name, (0, 0))[1] == number:
+                del pending[name]
+            if values[name] == value:
+                continue
+            values[name] = value
+            transitions[name] = transitions.get(name, 0) + 1
+            settle = now
+            for gate in fanout.get(name, ()):
+                schedule(gate, now)
+        return settle, transitions
+
+
+def glitches(transitions, nets=None):
+    """
+    Nets that changed more than once during one transition (hazards)
+
+    Args:
+        transitions (dict): Transition counts from TimingSimulator.apply
+        nets (re.Pattern): Only report nets whose names match
+
+    Returns:
+        list: (net, transitions) pairs
+    """
+    return sorted((name, count) for name, count in transitions.items()
+                  if count > 1 and (nets is None or nets.match(name)))
+
+
+def critical_path(net, delays=GATE_DELAYS, output=None):
+    """
+    Static timing analysis: worst-case arrival time at each net
+
+    Args:
+        net (Netlist): Netlist to analyse
+        output (str): Output to trace back from (the latest output by default)
+
+    Returns:
+        tuple: (arrival time in ns, [(net, gate type, arrival), ...] from
+        primary input to output)
+    """
+    arrival = {name: 0 for name in net.inputs}
+    arrival[VCC] = arrival[GND] = 0
+    previous = {}
+    for gates in net.levelize():
+        for gate in gates:
+            source = max(gate.inputs, key=arrival.__getitem__)
+            arrival[gate.output] = arrival[source] + max(delays[gate.type])
+            previous[gate.output] = source
+    output = output or max(net.outputs, key=arrival.__getitem__)
+    path = []
+    name = output
+    while name in previous:
+        path.append((name, net.drivers[name].type, arrival[name]))
+        name = previous[name]
+    path.append((name, "INPUT", 0))
+    return arrival[output], path[::-1]
+
+
+def alu_transitions(sim, width=2, vectors=None):
+    """
+    Simulate every transition between ALU input vectors
+
+    Returns:
+        dict: (op, a, b) -> (worst settle time over all previous vectors,
+        transitions that glitched a carry-path net, transitions that
+        glitched the CARRY output itself)
+    """
+    size = 1 << width
+    vectors = vectors or [(op, a, b) for _, op in OPERATIONS for a in range(size) for b in range(size)]
+    inputs = sim.net.inputs
+    settings = {v: dict(zip(inputs, alu_inputs(width, *v))) for v in vectors}
+    steady = {v: sim.steady_state(settings[v]) for v in vectors}
+    report = {}
+    for before in vectors:
+        for after in vectors:
+            sim.load(steady[before])
+            settle, transitions = sim.apply(settings[after])
+            worst, path_glitches, output_glitches = report.get(after, (0, 0, 0))
+            report[after] = (max(worst, settle),
+                             path_glitches + bool(glitches(transitions, CARRY_NET)),
+                             output_glitches + (transitions.get("CARRY", 0) > 1))
+    return report
+
+
+def compare_adders(widths=(4, 8, 16, 32), samples=2000, seed=1):
+    """
+    Compare ripple-carry and carry-lookahead adders
+
+    Returns:
+        list: (width, architecture, gates, levels, critical path ns,
+        worst simulated settle ns, transitions per second)
+    """
+    rng = random.Random(seed)
+    rows = []
+    for width in widths:
+        for architecture in ("ripple", "lookahead"):
+            net = build_adder(width, architecture)
+            delay, _ = critical_path(net)
+            sim = TimingSimulator(net)
+            # Start with the transition that ripples through every bit:
+            # A = all ones, B = 0, carry-in rising
+            sim.load({name: int(name.startswith("A")) for name in net.inputs})
+            worst, _ = sim.apply({"CIN": 1})
+            start = time.perf_counter()
+            for _ in range(samples):
+                changes = {name: rng.getrandbits(1) for name in net.inputs}
+                settle, _ = sim.apply(changes)
+                worst = max(worst, settle)
+            rate = samples / (time.perf_counter() - start)
+            rows.append((width, architecture, len(net.gates), len(net.levelize()), delay, worst, rate))
+    return rows
+
+
+def main(argv=None):
+    """Command-line entry point for the timing report"""
+    parser = argparse.ArgumentParser(description="Timing simulation of the gate-level ALU")
+    parser.add_argument("--samples", type=int, default=2000,
+                        help="random transitions per adder in the comparison (default: 2000)")
+    args = parser.parse_args(argv)
+
+    print("ALU TIMING (typical 74LS delays)")
+    print("================================")
+    net = build_alu_netlist(2)
+    sim = TimingSimulator(net)
+    start = time.perf_counter()
+    report = alu_transitions(sim)
+    elapsed = time.perf_counter() - start
+    count = len(report) ** 2
+    print(f"Simulated {count} transitions ({sim.events} events) in {elapsed:.2f} s\n")
+
+    print("Worst-case settle time (ns) for each vector, over every previous vector")
+    header = "  ".join(f"{a:02b}:{b:02b}" for a in range(4) for b in range(4))
+    print(f"{'A:B':<5} {header}")
+    for name, op in OPERATIONS:
+        row = "  ".join(f"{report[(op, a, b)][0]:>5}" for a in range(4) for b in range(4))
+        print(f"{name:<5} {row}")
+
+    internal = sum(n for _, n, _ in report.values())
+    flagged = [(vector, n) for vector, (_, _, n) in report.items() if n]
+    print(f"\nCarry-path glitches: {internal} of {count} transitions glitch an internal "
+          f"carry net; {sum(n for _, n in flagged)} glitch the CARRY output")
+    for (op, a, b), n in sorted(flagged, key=lambda item: -item[1])[:8]:
+        print(f"  {OP_NAMES[op]} {a:02b} {b:02b}: CARRY glitches on {n} incoming transitions")
+
+    delay, path = critical_path(net)
+    print(f"\nALU critical path: {delay} ns")
+    print("  " + " -> ".join(f"{name}" for name, _, _ in path))
+    delay, path = critical_path(net, output="CARRY")
+    print(f"ALU carry output: {delay} ns")
+    adder = build_adder(2)
+    delay, path = critical_path(adder)
+    print(f"2-bit ripple adder critical path: {delay} ns")
+    print("  " + " -> ".join(f"{name} ({kind} @{t})" for name, kind, t in path))
+
+    print("\nWidth  Adder       Gates  Levels  Critical (ns)  Simulated worst (ns)  Transitions/s")
+    print("-" * 86)
+    for width, architecture, gates, levels, delay, worst, rate in compare_adders(samples=args.samples):
+        print(f"{width:>5}  {architecture:<10} {gates:>6}  {levels:>6}  {delay:>13}  {worst:>20}  {rate:>13,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+ALU Trace Files
+This module replays streams of ALU operations at constant memory:
+- Binary traces: one byte per operation, (op << 4) | (a << 2) | b, with one
+  result byte per operation, (carry << 2) | result, written back
+- Text traces: one "OP A B" line per operation, answered with
+  "OP A B RESULT CARRY" lines
+- Input is read in bounded chunks (memory-mapped for binary files) and
+  pushed through a generator pipeline
+"""
+
+import mmap
+import os
+import sys
+
+from alu_simulator import OP_NAMES, LookupALU, format_binary, parse_op
+
+CHUNK_SIZE = 1 << 20
+INVALID = 0xFF
+
+
+
+def _result_bytes():
+    """Build the 256-byte translation table from input record to result record"""
+    out = bytearray([INVALID]) * 256
+    for index, entry in enumerate(LookupALU().table):
+        if entry is not None:
+            result, carry = entry
+            out[index] = (carry << 2) | result
+    return bytes(out)
+
+
+RESULT_BYTES = _result_bytes()
+
+
+def encode_record(op_code, a, b):
+    """Encode one operation as a binary trace record"""
+    return (op_code << 4) | (a << 2) | b
+
+
+def decode_result(record):
+    """Decode a binary result record into (result, carry)"""
+    return record & 0b11, record >> 2
+
+
+def read_binary_chunks(path, chunk_size=CHUNK_SIZE):
+    """
+    Yield a binary trace in chunks of at most chunk_size bytes
+
+    Regular files are memory-mapped; "-" reads standard input.
+    """
+    if path == "-":
+        stream = sys.stdin.buffer
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, len(mapped), chunk_size):
+                yield mapped[start:start + chunk_size]
+
+
+def execute_binary(chunks):
+    """Translate input record chunks into result record chunks"""
+    offset = 0
+    for chunk in chunks:
+        out = chunk.translate(RESULT_BYTES)
+        bad = out.find(INVALID)
+        if bad != -1:
+            record = chunk[bad]
+            raise ValueError(f"Invalid record 0x{record:02x} at offset {offset + bad}")
+        offset += len(chunk)
+        yield out
+
+
+def read_text_lines(path, chunk_size=CHUNK_SIZE):
+    """Yield lists of text lines, roughly chunk_size bytes per list"""
+    stream = sys.stdin if path == "-" else open(path, "r")
+    try:
+        while True:
+            lines = stream.readlines(chunk_size)
+            if not lines:
+                return
+            yield lines
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def parse_operation(line):
+    """Parse an "OP A B" line; OP is a name or number, A and B accept 0b/0x prefixes"""
+    parts = line.split()
+    if len(parts) == 2 and parts[0].upper() == "NOT":
+        parts.append("0")
+    if len(parts) != 3:
+        raise ValueError(f"Expected 'OP A B', got: {line.strip()!r}")
+    return parse_op(parts[0]), int(parts[1], 0), int(parts[2], 0)
+
+
+def read_operations(path, fmt="text", chunk_size=CHUNK_SIZE):
+    """
+    Yield the (op_code, a, b) operations recorded in a trace file
+
+    Args:
+        path (str): Trace to read ("-" for stdin)
+        fmt (str): "text" or "binary"
+    """
+    if fmt == "binary":
+        for chunk in read_binary_chunks(path, chunk_size):
+            for record in chunk:
+                if record >> 4 not in OP_NAMES:
+                    raise ValueError(f"Invalid record 0x{record:02x}")
+                yield record >> 4, (record >> 2) & 0b11, record & 0b11
+    elif fmt == "text":
+        for lines in read_text_lines(path, chunk_size):
+            for line in lines:
+                if line.strip() and not line.lstrip().startswith("#"):
+                    yield parse_operation(line)
+    else:
+        raise ValueError(f"Unknown trace format: {fmt}")
+
+
+def execute_text(line_chunks, alu=None):
+    """Translate chunks of "OP A B" lines into chunks of result text"""
+    alu = alu or LookupALU()
+    execute = alu.execute
+    number = 0
+    for lines in line_chunks:
+        out = []
+        for line in lines:
+            number += 1
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                op_code, a, b = parse_operation(line)
+                result, carry = execute(op_code, a, b)
+            except ValueError as e:
+                raise ValueError(f"Line {number}: {e}") from None
+            out.append(f"{OP_NAMES[op_code]} {format_binary(a)} {format_binary(b)} "
+                       f"{format_binary(result)} {carry}\n")
+        yield "".join(out)
+
+
+def replay(input_path, output_path="-", fmt="text", chunk_size=CHUNK_SIZE):
+    """
+    Replay a trace file and write the results
+
+    Args:
+        input_path (str): Trace to read ("-" for stdin)
+        output_path (str): Where to write results ("-" for stdout)
+        fmt (str): "text" or "binary"
+        chunk_size (int): Bytes read per chunk
+
+    Returns:
+        int: Number of bytes (binary) or characters (text) written
+    """
+    if fmt == "binary":
+        pipeline = execute_binary(read_binary_chunks(input_path, chunk_size))
+        out = sys.stdout.buffer if output_path == "-" else open(output_path, "wb")
+    elif fmt == "text":
+        pipeline = execute_text(read_text_lines(input_path, chunk_size))
+        out = sys.stdout if output_path == "-" else open(output_path, "w")
+    else:
+        raise ValueError(f"Unknown trace format: {fmt}")
+
+    written = 0
+    try:
+        for chunk in pipeline:
+            out.write(chunk)
+            written += len(chunk)
+    finally:
+        if output_path == "-":
+            out.flush()
+        else:
+            out.close()
+    return written
@@ -0,0 +1,194 @@
+"""
+Bit-Parallel ALU Verification
+This module checks the gate-level ALU against the behavioural model with
+64 test vectors packed into every machine word:
+- Each input bit becomes a uint64 word per group of 64 vectors
+- The compiled netlist evaluates all lanes with bitwise operations
+- Results are unpacked and compared with NBitALU.execute_batch
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from alu_netlist import ADDER_ARCHITECTURES, build_alu_netlist
+from alu_simulator import NBitALU, format_binary
+
+OPCODE_COUNT = 6
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def pack_bits(values, bit):
+    """Pack bit `bit` of every value into uint64 words (vector j -> word j//64, lane j%64)"""
+    plane = ((values >> np.uint64(bit)) & np.uint64(1)).astype(np.uint8)
+    return np.packbits(plane, bitorder="little").view("<u8")
+
+
+def unpack_bits(words, count):
+    """Unpack uint64 words back into one 0/1 value per vector"""
+    return np.unpackbits(words.view(np.uint8), bitorder="little", count=count)
+
+
+class PackedVerifier:
+    """Compares the compiled netlist with the reference ALU, 64 vectors per word"""
+
+    def __init__(self, width=2, net=None, evaluate=None):
+        """
+        Args:
+            width (int): Operand width in bits
+            net (Netlist): Device under test (the ALU netlist by default)
+            evaluate (function): Already-compiled evaluation function for the
+                netlist, e.g. one with faults injected
+        """
+        self.width = width
+        self.net = net or build_alu_netlist(width)
+        self.evaluate = evaluate or self.net.compile()
+        self.reference = NBitALU(width)
+        self.space = self.space_size(width)
+
+    @staticmethod
+    def space_size(width):
+        """Number of (op, a, b) vectors in the exhaustive space"""
+        return OPCODE_COUNT << (2 * width)
+
+    def vectors(self, start, stop):
+        """Decode exhaustive vector indices [start, stop) into (ops, a, b) arrays"""
+        index = np.arange(start, stop, dtype=np.uint64)
+        mask = np.uint64((1 << self.width) - 1)
+        shift = np.uint64(self.width)
+        b = index & mask
+        a = (index >> shift) & mask
+        ops = index >> (shift + shift)
+        return ops, a, b
+
+    def check(self, ops, a, b):
+        """
+        Check one batch of vectors
+
+        Args:
+            ops, a, b (ndarray): uint64 operand arrays of equal length
+
+        Returns:
+            tuple: (mismatch count, index of first mismatch or None,
+                    device results, device carries)
+        """
+        count = len(a)
+        pad = -count % 64
+        if pad:
+            ops = np.concatenate([ops, np.zeros(pad, np.uint64)])
+            a = np.concatenate([a, np.zeros(pad, np.uint64)])
+            b = np.concatenate([b, np.zeros(pad, np.uint64)])
+
+        # Bit-slice the inputs in netlist order: A0.., B0.., OP0-OP2
+        planes = ([pack_bits(a, i) for i in range(self.width)]
+                  + [pack_bits(b, i) for i in range(self.width)]
+                  + [pack_bits(ops, i) for i in range(3)])
+        outputs = self.evaluate(*planes, ALL_ONES)
+
+        result = np.zeros(count, dtype=np.uint64)
+        for i in range(self.width):
+            result |= unpack_bits(outputs[i], count).astype(np.uint64) << np.uint64(i)
+        carry = unpack_bits(outputs[self.width], count)
+
+        expected, expected_carry = self.reference.execute_batch(
+            ops[:count], a[:count], b[:count])
+        bad = (result != expected) | (carry != expected_carry)
+        mismatches = int(np.count_nonzero(bad))
+        first = int(np.argmax(bad)) if mismatches else None
+        return mismatches, first, result, carry
+
+    def run(self, start=0, stop=None, chunk=1 << 20):
+        """
+        Check the exhaustive vector range [start, stop) chunk by chunk
+
+        Returns:
+            dict: vectors, mismatches, carries, first mismatch and elapsed time
+        """
+        stop = self.space if stop is None else stop
+        stats = {"vectors": 0, "mismatches": 0, "carries": 0, "first": None, "elapsed": 0.0}
+        begin = time.perf_counter()
+        for lo in range(start, stop, chunk):
+            hi = min(lo + chunk, stop)
+            ops, a, b = self.vectors(lo, hi)
+            self._record(stats, ops, a, b)
+        stats["elapsed"] = time.perf_counter() - begin
+        return stats
+
+    def run_random(self, count, seed=0, chunk=1 << 20):
+        """
+        Check `count` random vectors
+
+        Returns:
+            dict: vectors, mismatches, carries, first mismatch and elapsed time
+        """
+        rng = np.random.default_rng(seed)
+        top = (1 << self.width) - 1
+        stats = {"vectors": 0, "mismatches": 0, "carries": 0, "first": None, "elapsed": 0.0}
+        begin = time.perf_counter()
+        for lo in range(0, count, chunk):
+            size = min(chunk, count - lo)
+            ops = rng.integers(0, OPCODE_COUNT, size, dtype=np.uint64)
+            a = rng.integers(0, top, size, dtype=np.uint64, endpoint=True)
+            b = rng.integers(0, top, size, dtype=np.uint64, endpoint=True)
+            self._record(stats, ops, a, b)
+        stats["elapsed"] = time.perf_counter() - begin
+        return stats
+
+    def _record(self, stats, ops, a, b):
+        """Check a batch and fold its outcome into the running statistics"""
+        mismatches, first, result, carry = self.check(ops, a, b)
+        if mismatches and stats["first"] is None:
+            expected = self.reference.execute(int(ops[first]), int(a[first]), int(b[first]))
+            stats["first"] = (int(ops[first]), int(a[first]), int(b[first]),
+                              expected, (int(result[first]), int(carry[first])))
+        stats["vectors"] += len(a)
+        stats["mismatches"] += mismatches
+        stats["carries"] += int(np.count_nonzero(carry))
+
+
+def describe_mismatch(width, mismatch):
+    """Format a (op, a, b, expected, actual) mismatch record"""
+    op_code, a, b, expected, actual = mismatch
+    return (f"op={format_binary(op_code, 3)} A={format_binary(a, width)} "
+            f"B={format_binary(b, width)} expected={format_binary(expected[0], width)}/"
+            f"{expected[1]} got={format_binary(actual[0], width)}/{actual[1]}")
+
+
+def main(argv=None):
+    """Command-line entry point for bit-parallel verification"""
+    parser = argparse.ArgumentParser(description="Bit-parallel ALU netlist verification")
+    parser.add_argument("--width", type=int, default=2, help="operand width in bits")
+    parser.add_argument("--random", type=int, metavar="N",
+                        help="check N random vectors instead of the exhaustive space")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--adder", choices=ADDER_ARCHITECTURES, default="ripple",
+                        help="adder carry structure of the netlist (default: ripple)")
+    args = parser.parse_args(argv)
+    if not 1 <= args.width <= 64:
+        parser.error("--width must be between 1 and 64")
+
+    verifier = PackedVerifier(args.width, build_alu_netlist(args.width, args.adder))
+    if args.random:
+        stats = verifier.run_random(args.random, args.seed)
+        mode = "random"
+    else:
+        if args.width > 12:
+            parser.error("exhaustive checks are limited to 12 bits; use --random")
+        stats = verifier.run()
+        mode = "exhaustive"
+
+    rate = stats["vectors"] / stats["elapsed"] if stats["elapsed"] else 0.0
+    print(f"{args.width}-bit {mode} check: {stats['vectors']:,} vectors "
+          f"in {stats['elapsed']:.3f} s ({rate:,.0f} vectors/s)")
+    if stats["first"] is None:
+        print("No mismatches")
+        return 0
+    print(f"{stats['mismatches']:,} mismatches; first: "
+          f"{describe_mismatch(args.width, stats['first'])}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
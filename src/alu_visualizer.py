@@ -4,91 +4,72 @@ This module provides a GUI to visualize the 2-bit ALU operations
 and show the corresponding logic gate connections.
 """
 
+import sys
+import time
 import tkinter as tk
-from tkinter import ttk
-import math
-from alu_simulator import ALU, format_binary
+from tkinter import filedialog, ttk
+from alu_simulator import ALU, OP_NAMES, LookupALU, format_binary
+from alu_circuit import CircuitView
 
-class LogicGate:
-    """Represents a logic gate for drawing"""
-    def __init__(self, canvas, x, y, gate_type, inputs=None, label=""):
+class Waveform:
+    """
+    VCD-style waveform panel for a recorded sequence of ALU steps
+    
+    One polyline per signal and a cursor are created once; each frame
+    only moves their coordinates, so long traces play back smoothly.
+    """
+    
+    SIGNALS = [
+        ("A[1]", lambda step: step[1] >> 1),
+        ("A[0]", lambda step: step[1] & 1),
+        ("B[1]", lambda step: step[2] >> 1),
+        ("B[0]", lambda step: step[2] & 1),
+        ("R[1]", lambda step: step[3] >> 1),
+        ("R[0]", lambda step: step[3] & 1),
+        ("Carry", lambda step: step[4]),
+    ]
+    
+    def __init__(self, canvas, window=64, left=60, row_height=18, step_width=12):
         self.canvas = canvas
-        self.x = x
-        self.y = y
-        self.type = gate_type
-        self.inputs = inputs or []
-        self.label = label
-        self.width = 60
-        self.height = 40
-        self.output_x = x + self.width
-        self.output_y = y + self.height/2
-        
-    def draw(self):
-        """Draw the logic gate on the canvas"""
-        if self.type == "AND":
-            # Draw AND gate
-            self.canvas.create_rectangle(self.x, self.y, self.x + self.width*0.7, self.y + self.height)
-            self.canvas.create_arc(
-                self.x + self.width*0.2, self.y, 
-                self.x + self.width*1.1, self.y + self.height,
-                start=270, extent=180, style="chord"
-            )
-        elif self.type == "OR":
-            # Draw OR gate
-            self.canvas.create_arc(
-                self.x - self.width*0.2, self.y, 
-                self.x + self.width*0.7, self.y + self.height,
-                start=270, extent=180, style="chord"
-            )
-            self.canvas.create_arc(
-                self.x - self.width*0.1, self.y, 
-                self.x + self.width*0.8, self.y + self.height,
-                start=270, extent=180, style="chord"
-            )
-        elif self.type == "XOR":
-            # Draw XOR gate (OR with extra curve)
-            self.canvas.create_arc(
-                self.x - self.width*0.2, self.y, 
-                self.x + self.width*0.7, self.y + self.height,
-                start=270, extent=180, style="chord"
-            )
-            self.canvas.create_arc(
-                self.x - self.width*0.1, self.y, 
-                self.x + self.width*0.8, self.y + self.height,
-                start=270, extent=180, style="chord"
-            )
-            self.canvas.create_arc(
-                self.x - self.width*0.3, self.y, 
-                self.x + self.width*0.6, self.y + self.height,
-                start=270, extent=180, style="arc"
-            )
-        elif self.type == "NOT":
-            # Draw NOT gate
-            self.canvas.create_polygon(
-                self.x, self.y,
-                self.x, self.y + self.height,
-                self.x + self.width*0.7, self.y + self.height/2
-            )
-            self.canvas.create_oval(
-                self.x + self.width*0.7, self.y + self.height/2 - 5,
-                self.x + self.width*0.7 + 10, self.y + self.height/2 + 5
-            )
-            
-        # Draw label
-        self.canvas.create_text(self.x + self.width/2, self.y - 10, text=self.label)
-        
-        # Draw output line
-        self.canvas.create_line(
-            self.output_x, self.output_y, 
-            self.output_x + 30, self.output_y
-        )
-        
-        # Draw input lines
-        input_spacing = self.height / (len(self.inputs) + 1)
-        for i, input_label in enumerate(self.inputs):
-            input_y = self.y + input_spacing * (i + 1)
-            self.canvas.create_line(self.x - 30, input_y, self.x, input_y)
-            self.canvas.create_text(self.x - 40, input_y, text=input_label)
+        self.window = window
+        self.left = left
+        self.row_height = row_height
+        self.step_width = step_width
+        self.lines = []
+        for i, (name, _) in enumerate(self.SIGNALS):
+            base = self.row_height * (i + 1)
+            canvas.create_text(self.left - 10, base - self.row_height / 3, text=name, anchor="e")
+            self.lines.append(canvas.create_line(self.left, base, self.left, base, fill="green"))
+        height = self.row_height * (len(self.SIGNALS) + 1)
+        self.cursor = canvas.create_line(self.left, 0, self.left, height, fill="red")
+        self.first = None
+    
+    def reset(self):
+        """Clear the panel so the next update redraws for a new trace"""
+        for i, line in enumerate(self.lines):
+            base = self.row_height * (i + 1)
+            self.canvas.coords(line, self.left, base, self.left, base)
+        self.canvas.coords(self.cursor, self.left, 0, self.left, self.row_height * (len(self.SIGNALS) + 1))
+        self.first = None
+    
+    def update(self, steps, index):
+        """Show the window of steps around index with the cursor on index"""
+        first = min(max(0, index - self.window // 2), max(0, len(steps) - self.window))
+        if first != self.first:
+            visible = steps[first:first + self.window]
+            high = self.row_height * 0.7
+            for i, (_, probe) in enumerate(self.SIGNALS):
+                base = self.row_height * (i + 1)
+                points = []
+                for k, step in enumerate(visible):
+                    y = base - high * probe(step)
+                    x = self.left + k * self.step_width
+                    points.extend((x, y, x + self.step_width, y))
+                if points:
+                    self.canvas.coords(self.lines[i], *points)
+            self.first = first
+        x = self.left + (index - first + 0.5) * self.step_width
+        self.canvas.coords(self.cursor, x, 0, x, self.row_height * (len(self.SIGNALS) + 1))
 
 
 class ALUVisualizer:
@@ -97,11 +78,11 @@ class ALUVisualizer:
     def __init__(self, root):
         self.root = root
         self.root.title("2-Bit ALU Visualizer")
-        self.root.geometry("900x600")
+        self.root.geometry("900x850")
         self.alu = ALU()
         
         self.create_widgets()
-        
+    
     def create_widgets(self):
         """Create all the GUI widgets"""
         # Main frame
@@ -133,7 +114,7 @@ class ALUVisualizer:
         # Operation selector
         ttk.Label(input_frame, text="Operation:").grid(row=2, column=0, padx=5, pady=5)
         self.op_var = tk.StringVar(value="AND")
-        op_combobox = ttk.Combobox(input_frame, textvariable=self.op_var, 
+        op_combobox = ttk.Combobox(input_frame, textvariable=self.op_var,
                                    values=["AND", "OR", "XOR", "ADD", "SUB", "NOT"])
         op_combobox.grid(row=2, column=1, columnspan=2, padx=5, pady=5)
         op_combobox.bind("<<ComboboxSelected>>", self.update_display)
@@ -156,24 +137,151 @@ class ALUVisualizer:
         
         self.canvas = tk.Canvas(self.canvas_frame, bg="white")
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.circuit_view = CircuitView(self.canvas)
+        
+        self.create_playback_widgets(main_frame)
         
         # Update the display initially
         self.update_display()
-        
+    
+    def create_playback_widgets(self, parent):
+        """Create the trace timeline, scrub bar and waveform panel"""
+        self.steps = []
+        self.playing = False
+        self.position = 0.0
+        self.step_index = None
+        self._last_tick = None
+        self._scrubbing = False
+        
+        playback_frame = ttk.LabelFrame(parent, text="Trace Playback", padding="10")
+        playback_frame.pack(fill=tk.X, pady=5)
+        
+        controls = ttk.Frame(playback_frame)
+        controls.pack(fill=tk.X)
+        ttk.Button(controls, text="Load Trace...", command=self.choose_trace).pack(side=tk.LEFT, padx=5)
+        self.play_button = ttk.Button(controls, text="Play", command=self.toggle_playback)
+        self.play_button.pack(side=tk.LEFT, padx=5)
+        ttk.Label(controls, text="Steps/s:").pack(side=tk.LEFT, padx=5)
+        self.rate_var = tk.DoubleVar(value=10.0)
+        ttk.Spinbox(controls, from_=0.5, to=10000, increment=5, width=8,
+                    textvariable=self.rate_var).pack(side=tk.LEFT)
+        self.step_var = tk.StringVar(value="No trace loaded")
+        ttk.Label(controls, textvariable=self.step_var).pack(side=tk.LEFT, padx=10)
+        
+        self.scrub = ttk.Scale(playback_frame, from_=0, to=0, orient=tk.HORIZONTAL,
+                               command=self.on_scrub)
+        self.scrub.pack(fill=tk.X, pady=5)
+        
+        wave_canvas = tk.Canvas(playback_frame, bg="white", height=150)
+        wave_canvas.pack(fill=tk.X)
+        self.waveform = Waveform(wave_canvas)
+    
+    def choose_trace(self):
+        """Ask for a trace file and load it"""
+        path = filedialog.askopenfilename(
+            filetypes=[("Text traces", "*.txt"), ("Binary traces", "*.bin"), ("All files", "*")])
+        if path:
+            self.load_trace(path, "binary" if path.endswith(".bin") else "text")
+    
+    def load_trace(self, path, fmt="text"):
+        """Load a recorded sequence of (op, a, b) steps and show the first one"""
+        from alu_trace import read_operations
+        
+        table = LookupALU().table
+        self.steps = [(op_code, a, b) + table[(op_code << 4) | (a << 2) | b]
+                      for op_code, a, b in read_operations(path, fmt)]
+        self.playing = False
+        self.play_button.configure(text="Play")
+        self.position = 0.0
+        self.step_index = None
+        self.waveform.reset()
+        self.scrub.configure(to=max(0, len(self.steps) - 1))
+        if self.steps:
+            self.show_step(0)
+        else:
+            self._scrubbing = True
+            self.scrub.set(0)
+            self._scrubbing = False
+            self.step_var.set("Trace is empty")
+    
+    def toggle_playback(self):
+        """Start or pause playback"""
+        if not self.steps:
+            return
+        self.playing = not self.playing
+        self.play_button.configure(text="Pause" if self.playing else "Play")
+        if self.playing:
+            if self.step_index == len(self.steps) - 1:
+                self.position = 0.0
+            self._last_tick = time.perf_counter()
+            self.root.after(16, self.tick)
+    
+    def tick(self):
+        """Advance playback by the time since the last frame (about 60 fps)"""
+        if not self.playing:
+            return
+        now = time.perf_counter()
+        try:
+            rate = max(0.0, float(self.rate_var.get()))
+        except (tk.TclError, ValueError):
+            rate = 0.0
+        self.position += (now - self._last_tick) * rate
+        self._last_tick = now
+        index = int(self.position)
+        if index >= len(self.steps) - 1:
+            index = len(self.steps) - 1
+            self.playing = False
+            self.play_button.configure(text="Play")
+        self.show_step(index)
+        if self.playing:
+            self.root.after(16, self.tick)
+    
+    def on_scrub(self, value):
+        """Jump to the step under the scrub bar"""
+        if self._scrubbing or not self.steps:
+            return
+        index = int(float(value))
+        self.position = float(index)
+        self.show_step(index)
+    
+    def show_step(self, index):
+        """Display one recorded step, updating only what changed"""
+        if index == self.step_index:
+            return
+        self.step_index = index
+        op_code, a_val, b_val, result, carry = self.steps[index]
+        op_name = OP_NAMES[op_code]
+        
+        for button, bit in ((self.a_bit1, a_val >> 1), (self.a_bit0, a_val & 1),
+                            (self.b_bit1, b_val >> 1), (self.b_bit0, b_val & 1)):
+            button.state(["selected" if bit else "!selected"])
+        self.op_var.set(op_name)
+        self.input_a_var.set(format_binary(a_val))
+        self.input_b_var.set(format_binary(b_val))
+        self.result_var.set(format_binary(result))
+        self.carry_var.set(str(carry))
+        self.circuit_view.show(op_name, a_val, b_val, result, carry)
+        
+        self.waveform.update(self.steps, index)
+        self.step_var.set(f"Step {index + 1}/{len(self.steps)}")
+        self._scrubbing = True
+        self.scrub.set(index)
+        self._scrubbing = False
+    
     def update_a(self):
         """Update input A based on checkbuttons"""
         a_val = (1 if self.a_bit1.instate(['selected']) else 0) * 2 + \
                 (1 if self.a_bit0.instate(['selected']) else 0)
         self.input_a_var.set(format_binary(a_val))
         self.update_display()
-        
+    
     def update_b(self):
         """Update input B based on checkbuttons"""
         b_val = (1 if self.b_bit1.instate(['selected']) else 0) * 2 + \
                 (1 if self.b_bit0.instate(['selected']) else 0)
         self.input_b_var.set(format_binary(b_val))
         self.update_display()
-        
+    
     def update_display(self, *args):
         """Update the result and visualization based on current inputs"""
         try:
@@ -202,183 +310,19 @@ class ALUVisualizer:
             
             # Update visualization
             self.draw_circuit(op_name, a_val, b_val, result, carry)
-            
+        
         except Exception as e:
             print(f"Error updating display: {e}")
     
     def draw_circuit(self, op_name, a_val, b_val, result, carry):
-        """Draw the circuit diagram for the selected operation"""
-        # Clear canvas
-        self.canvas.delete("all")
-        
-        # Draw title
-        self.canvas.create_text(450, 30, text=f"2-Bit ALU: {op_name} Operation", font=("Arial", 16))
-        
-        # Draw input bits as switches
-        self.draw_input_bits(a_val, b_val)
-        
-        # Draw operation-specific circuit
-        if op_name == "AND":
-            self.draw_and_circuit(a_val, b_val, result)
-        elif op_name == "OR":
-            self.draw_or_circuit(a_val, b_val, result)
-        elif op_name == "XOR":
-            self.draw_xor_circuit(a_val, b_val, result)
-        elif op_name == "ADD":
-            self.draw_add_circuit(a_val, b_val, result, carry)
-        elif op_name == "SUB":
-            self.draw_sub_circuit(a_val, b_val, result, carry)
-        elif op_name == "NOT":
-            self.draw_not_circuit(a_val, result)
-            
-        # Draw output LEDs
-        self.draw_output_leds(result, carry)
-    
-    def draw_input_bits(self, a_val, b_val):
-        """Draw the input bits as switches"""
-        self.canvas.create_text(80, 80, text="Input A:", font=("Arial", 12))
-        self.canvas.create_text(110, 110, text=f"A[1] = {a_val >> 1}")
-        self.canvas.create_text(110, 140, text=f"A[0] = {a_val & 1}")
-        
-        self.canvas.create_text(80, 180, text="Input B:", font=("Arial", 12))
-        self.canvas.create_text(110, 210, text=f"B[1] = {b_val >> 1}")
-        self.canvas.create_text(110, 240, text=f"B[0] = {b_val & 1}")
-    
-    def draw_output_leds(self, result, carry):
-        """Draw the output LEDs"""
-        self.canvas.create_text(750, 100, text="Output:", font=("Arial", 12))
-        
-        # Result bit 1
-        led_color = "red" if result & 2 else "white"
-        self.canvas.create_oval(750, 130, 780, 160, fill=led_color, outline="black")
-        self.canvas.create_text(790, 145, text=f"Result[1] = {result >> 1}")
-        
-        # Result bit 0
-        led_color = "red" if result & 1 else "white"
-        self.canvas.create_oval(750, 180, 780, 210, fill=led_color, outline="black")
-        self.canvas.create_text(790, 195, text=f"Result[0] = {result & 1}")
-        
-        # Carry/Borrow
-        if carry is not None:
-            led_color = "red" if carry else "white"
-            self.canvas.create_oval(750, 230, 780, 260, fill=led_color, outline="black")
-            self.canvas.create_text(790, 245, text=f"Carry/Borrow = {carry}")
-    
-    def draw_and_circuit(self, a_val, b_val, result):
-        """Draw the AND circuit"""
-        # Draw bit 1 AND gate
-        and1 = LogicGate(self.canvas, 350, 100, "AND", ["A[1]", "B[1]"], "AND1")
-        and1.draw()
-        
-        # Draw bit 0 AND gate
-        and0 = LogicGate(self.canvas, 350, 200, "AND", ["A[0]", "B[0]"], "AND0")
-        and0.draw()
-        
-        # Connect to outputs
-        self.canvas.create_line(and1.output_x + 30, and1.output_y, 750, 145)
-        self.canvas.create_line(and0.output_x + 30, and0.output_y, 750, 195)
-    
-    def draw_or_circuit(self, a_val, b_val, result):
-        """Draw the OR circuit"""
-        # Draw bit 1 OR gate
-        or1 = LogicGate(self.canvas, 350, 100, "OR", ["A[1]", "B[1]"], "OR1")
-        or1.draw()
-        
-        # Draw bit 0 OR gate
-        or0 = LogicGate(self.canvas, 350, 200, "OR", ["A[0]", "B[0]"], "OR0")
-        or0.draw()
-        
-        # Connect to outputs
-        self.canvas.create_line(or1.output_x + 30, or1.output_y, 750, 145)
-        self.canvas.create_line(or0.output_x + 30, or0.output_y, 750, 195)
-    
-    def draw_xor_circuit(self, a_val, b_val, result):
-        """Draw the XOR circuit"""
-        # Draw bit 1 XOR gate
-        xor1 = LogicGate(self.canvas, 350, 100, "XOR", ["A[1]", "B[1]"], "XOR1")
-        xor1.draw()
-        
-        # Draw bit 0 XOR gate
-        xor0 = LogicGate(self.canvas, 350, 200, "XOR", ["A[0]", "B[0]"], "XOR0")
-        xor0.draw()
-        
-        # Connect to outputs
-        self.canvas.create_line(xor1.output_x + 30, xor1.output_y, 750, 145)
-        self.canvas.create_line(xor0.output_x + 30, xor0.output_y, 750, 195)
-    
-    def draw_add_circuit(self, a_val, b_val, result, carry):
-        """Draw the ADD circuit (simplified)"""
-        # Half adders and OR gate for simplified view
-        ha1 = LogicGate(self.canvas, 250, 100, "XOR", ["A[0]", "B[0]"], "HA1-Sum")
-        ha1.draw()
-        
-        ha2 = LogicGate(self.canvas, 250, 180, "AND", ["A[0]", "B[0]"], "HA1-Carry")
-        ha2.draw()
-        
-        ha3 = LogicGate(self.canvas, 400, 100, "XOR", ["A[1]", "B[1]"], "HA2-Sum")
-        ha3.draw()
-        
-        ha4 = LogicGate(self.canvas, 400, 180, "AND", ["A[1]", "B[1]"], "HA2-Carry")
-        ha4.draw()
-        
-        ha5 = LogicGate(self.canvas, 550, 130, "XOR", ["HA2-Sum", "HA1-Carry"], "R[1]")
-        ha5.draw()
-        
-        or1 = LogicGate(self.canvas, 550, 230, "OR", ["HA2-Carry", "Carry-Internal"], "Carry")
-        or1.draw()
-        
-        # Connect the gates
-        self.canvas.create_line(ha1.output_x + 30, ha1.output_y, 750, 195)  # R[0]
-        self.canvas.create_line(ha2.output_x + 30, ha2.output_y, 450, 150)
-        self.canvas.create_text(420, 140, text="Carry-Internal")
-        
-        self.canvas.create_line(ha5.output_x + 30, ha5.output_y, 750, 145)  # R[1]
-        self.canvas.create_line(or1.output_x + 30, or1.output_y, 750, 245)  # Carry
-    
-    def draw_sub_circuit(self, a_val, b_val, result, borrow):
-        """Draw the SUB circuit (simplified)"""
-        # For subtraction, we'll show converter to 2's complement and then adder
-        not1 = LogicGate(self.canvas, 200, 100, "NOT", ["B[1]"], "NOT-B[1]")
-        not1.draw()
-        
-        not0 = LogicGate(self.canvas, 200, 180, "NOT", ["B[0]"], "NOT-B[0]")
-        not0.draw()
-        
-        # Show simplified 2's complement logic
-        self.canvas.create_text(350, 240, text="2's Complement Logic", font=("Arial", 10))
-        self.canvas.create_text(350, 260, text="B' = NOT(B) + 1", font=("Arial", 8))
-        
-        # And then reuse add circuit visualization
-        ha1 = LogicGate(self.canvas, 450, 100, "XOR", ["A[1]", "B'[1]"], "R[1]")
-        ha1.draw()
-        
-        ha0 = LogicGate(self.canvas, 450, 180, "XOR", ["A[0]", "B'[0]"], "R[0]")
-        ha0.draw()
-        
-        borrow_gate = LogicGate(self.canvas, 450, 260, "AND", ["Borrow Logic"], "Borrow")
-        borrow_gate.draw()
-        
-        # Connect to outputs
-        self.canvas.create_line(ha1.output_x + 30, ha1.output_y, 750, 145)
-        self.canvas.create_line(ha0.output_x + 30, ha0.output_y, 750, 195)
-        self.canvas.create_line(borrow_gate.output_x + 30, borrow_gate.output_y, 750, 245)
-    
-    def draw_not_circuit(self, a_val, result):
-        """Draw the NOT circuit"""
-        # Draw bit 1 NOT gate
-        not1 = LogicGate(self.canvas, 350, 100, "NOT", ["A[1]"], "NOT1")
-        not1.draw()
-        
-        # Draw bit 0 NOT gate
-        not0 = LogicGate(self.canvas, 350, 200, "NOT", ["A[0]"], "NOT0")
-        not0.draw()
-        
-        # Connect to outputs
-        self.canvas.create_line(not1.output_x + 30, not1.output_y, 750, 145)
-        self.canvas.create_line(not0.output_x + 30, not0.output_y, 750, 195)
+        """Show the circuit diagram for the selected operation"""
+        self.circuit_view.show(op_name, a_val, b_val, result, carry)
 
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = ALUVisualizer(root)
+    if len(sys.argv) > 1:
+        # Optional trace file to play back: alu_visualizer.py TRACE [text|binary]
+        app.load_trace(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "text")
     root.mainloop()
@@ -0,0 +1,61 @@
+"""
+Tests for the vectorized ALU paths (alu_simulator execute_batch)
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from alu_simulator import ALU, LookupALU, NBitALU  # noqa: E402
+
+
+class ExecuteBatchTest(unittest.TestCase):
+
+    def test_full_width_operands_stay_exact(self):
+        # A list mixing 2**64-1 and 2**63 would be inferred as float64
+        alu = NBitALU(64)
+        top = 2**64 - 1
+        result, carry = alu.execute_batch([ALU.ADD] * 3, [top, 0, 2**63], [1, 0, 2**63])
+        self.assertEqual(result.tolist(), [0, 0, 0])
+        self.assertEqual(carry.tolist(), [1, 0, 1])
+        result, carry = alu.execute_batch([ALU.SUB, ALU.NOT], [0, top], [1, 0])
+        self.assertEqual(result.tolist(), [top, 0])
+        self.assertEqual(carry.tolist(), [1, 0])
+
+    def test_float_operands_rejected(self):
+        alu = NBitALU(8)
+        for operand in ([1.7], np.array([1.7]), [2.0]):
+            with self.subTest(operand=operand), self.assertRaises(ValueError):
+                alu.execute_batch([ALU.ADD], operand, [2])
+
+    def test_out_of_range_operands_rejected(self):
+        for width, operand in ((64, [-1]), (64, [2**64]), (8, np.array([-1])), (8, [256])):
+            with self.subTest(width=width, operand=operand), self.assertRaises(ValueError):
+                NBitALU(width).execute_batch([ALU.ADD], operand, [0])
+
+    def test_bytes_inputs(self):
+        ops, a, b = bytes([ALU.ADD, ALU.SUB]), bytes([1, 2]), bytearray([2, 3])
+        result, carry = LookupALU().execute_batch(ops, a, b)
+        self.assertEqual((result.tolist(), carry.tolist()), ([3, 3], [0, 1]))
+        result, carry = NBitALU(8).execute_batch(ops, a, memoryview(b))
+        self.assertEqual((result.tolist(), carry.tolist()), ([3, 255], [0, 1]))
+
+    def test_matches_scalar_execute(self):
+        alu = NBitALU(8)
+        rng = np.random.default_rng(0)
+        ops = rng.integers(0, 6, 500)
+        a = rng.integers(0, 256, 500)
+        b = rng.integers(0, 256, 500)
+        result, carry = alu.execute_batch(ops, a, b)
+        expected = [alu.execute(int(o), int(x), int(y))[:2] for o, x, y in zip(ops, a, b)]
+        self.assertEqual(list(zip(result.tolist(), carry.tolist())), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests for the documentation preprocessor (convert_all_docs.preprocess_lines)
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import os
+import re
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from convert_all_docs import (MERMAID_NOTE, PRE_OPEN, diagram_ref,  # noqa: E402
+                              preprocess_lines, preprocess_markdown)
+
+
+def legacy_preprocess(md_content):
+    """The regex preprocessor that preprocess_lines replaced"""
+    md_content = md_content.replace('Ω', 'Ohm').replace('μ', 'u')
+    md_content = re.sub(r'```mermaid(.*?)```', MERMAID_NOTE, md_content, flags=re.DOTALL)
+    return re.sub(r'```(?!python|bash|javascript|json|html|css)(.+?)```',
+                  PRE_OPEN + r'\1</pre>', md_content, flags=re.DOTALL)
+
+
+def process(text, **options):
+    return ''.join(preprocess_lines(text.splitlines(True), **options))
+
+
+class PreprocessLinesTest(unittest.TestCase):
+
+    def test_mermaid_block_becomes_note(self):
+        text = "Before\n```mermaid\ngraph TD\n    A --> B\n```\nAfter\n"
+        self.assertEqual(process(text), "Before\n" + MERMAID_NOTE + "\nAfter\n")
+
+    def test_plain_block_becomes_pre(self):
+        text = "```\n+---+\n| A |\n+---+\n```\n"
+        self.assertEqual(process(text), PRE_OPEN + "\n+---+\n| A |\n+---+\n</pre>\n")
+
+    def test_python_fences_pair_correctly(self):
+        # The regex version paired the closing fence of the python block
+        # with the next opening fence and swallowed the text in between
+        text = ("```python\nx = 1\n```\n\nText between blocks\n\n"
+                "```python\ny = 2\n```\n")
+        self.assertEqual(process(text), text)
+        self.assertNotEqual(legacy_preprocess(text), text)
+
+    def test_python_block_contents_untouched(self):
+        text = "```python\nprint('```')  # not a fence\n```\n"
+        self.assertEqual(process(text), text)
+
+    def test_unterminated_fence_is_kept(self):
+        text = "Intro\n```\nno closing fence\nstill inside\n"
+        self.assertEqual(process(text), text)
+
+    def test_unicode_replaced_for_plain_text(self):
+        text = "Use a 330Ω resistor and a 0.1μF capacitor\n"
+        self.assertEqual(process(text), "Use a 330Ohm resistor and a 0.1uF capacitor\n")
+
+    def test_unicode_kept_for_html_backends(self):
+        text = "330Ω ─── 0.1μF\n```\nplain block\n```\n"
+        self.assertEqual(process(text, plain_text=False), text)
+
+    def test_diagram_blocks_become_relative_images(self):
+        diagrams = {}
+        text = "```mermaid\ngraph TD\n```\n```\n+--+\n```\n```\nnot a diagram\n```\n"
+        lines = process(text, diagrams=diagrams, base_dir="docs").splitlines()
+        self.assertEqual(len(diagrams), 2)
+        kinds = sorted(kind for kind, _ in diagrams.values())
+        self.assertEqual(kinds, ["mermaid", "pre"])
+        for key in diagrams:
+            ref = diagram_ref(key, "docs")
+            self.assertFalse(os.path.isabs(ref))
+            self.assertTrue(any(ref in line for line in lines))
+        self.assertIn(PRE_OPEN + "\nnot a diagram\n</pre>", "\n".join(lines))
+
+    def test_matches_regex_version_on_project_docs(self):
+        for name in ("README.md", os.path.join("hardware_design", "circuit_implementation.md")):
+            with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+                source = f.read()
+            with self.subTest(document=name):
+                self.assertEqual(preprocess_markdown(source), legacy_preprocess(source))
+
+
+if __name__ == "__main__":
+    unittest.main()